@@ -0,0 +1,136 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+
+from py_zipkin.encoding._helpers import Span
+
+if TYPE_CHECKING:  # pragma: no cover
+    from py_zipkin.logging_helper import ZipkinBatchSender
+
+
+log = logging.getLogger("py_zipkin.emitter")
+
+EmitJob = Tuple[List[Span], "ZipkinBatchSender"]
+
+# SimpleQueue's put() never blocks and doesn't need to notify waiters through
+# a Condition, so handing spans over is cheap for the thread exiting the span.
+# flush() enqueues an Event which the worker sets once it gets to it.
+EMITTER_QUEUE: "queue.SimpleQueue[Union[EmitJob, threading.Event]]" = (
+    queue.SimpleQueue()
+)
+
+# Max number of traces waiting to be emitted. If the transport can't keep up,
+# new traces are dropped rather than piling up in memory.
+MAX_QUEUED_TRACES = 10000
+
+# How long to wait for the queued traces to be emitted when the process exits.
+EXIT_FLUSH_TIMEOUT = 5.0
+
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # A forked child inherits the jobs still queued in its parent, which the
+    # parent sends itself, and the lock, which another thread may have been
+    # holding at fork time. The worker thread doesn't survive the fork.
+    global EMITTER_QUEUE, _worker, _worker_lock
+    EMITTER_QUEUE = queue.SimpleQueue()
+    _worker = None
+    _worker_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def submit(spans: List[Span], span_sender: "ZipkinBatchSender") -> None:
+    """Enqueues spans to be encoded and sent by the background worker.
+
+    The spans are dropped, and a warning logged, if MAX_QUEUED_TRACES traces
+    are already waiting to be emitted.
+
+    :param spans: spans collected for a trace.
+    :type spans: list of Span
+    :param span_sender: sender configured with the transport and encoder
+        that should be used for these spans.
+    :type span_sender: ZipkinBatchSender
+    """
+    # qsize() is only approximate with several threads submitting, which is
+    # fine for a bound that's only there to keep memory in check.
+    if EMITTER_QUEUE.qsize() >= MAX_QUEUED_TRACES:
+        log.warning(
+            f"Dropping {len(spans)} zipkin spans: {MAX_QUEUED_TRACES} traces "
+            "are already waiting to be emitted."
+        )
+        return
+    _ensure_worker()
+    EMITTER_QUEUE.put((spans, span_sender))
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Waits until all the enqueued spans have been emitted.
+
+    Useful in tests. It's also called at exit, waiting at most
+    EXIT_FLUSH_TIMEOUT seconds, since the worker is a daemon thread and
+    anything still in the queue is lost when the process exits.
+
+    :param timeout: max number of seconds to wait. Waits forever if None.
+    :type timeout: float
+    :returns: True if the queue was drained, False if it timed out.
+    :rtype: bool
+    """
+    if _worker is None:
+        # Nothing was ever submitted.
+        return True
+    # The queue is FIFO, so everything submitted so far has been emitted
+    # by the time the worker sets this event.
+    flushed = threading.Event()
+    _ensure_worker()
+    EMITTER_QUEUE.put(flushed)
+    return flushed.wait(timeout)
+
+
+def _flush_at_exit() -> None:
+    if not flush(timeout=EXIT_FLUSH_TIMEOUT):
+        log.warning("Timed out emitting the queued zipkin spans at exit.")
+
+
+atexit.register(_flush_at_exit)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    # Check the worker is still alive rather than just whether it was ever
+    # started, in case it died.
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run,
+                args=(EMITTER_QUEUE,),
+                name="py_zipkin.emitter",
+                daemon=True,
+            )
+            _worker.start()
+
+
+def _run(jobs: "queue.SimpleQueue[Union[EmitJob, threading.Event]]") -> None:
+    while True:
+        job = jobs.get()
+        if isinstance(job, threading.Event):
+            job.set()
+            continue
+        spans, span_sender = job
+        try:
+            span_sender.send(spans)
+        except Exception as ex:
+            log.error(f"Error emitting zipkin trace. {repr(ex)}")
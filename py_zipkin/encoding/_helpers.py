@@ -1,5 +1,5 @@
 import socket
-from collections import OrderedDict
+from typing import Any
 from typing import Dict
 from typing import MutableMapping
 from typing import NamedTuple
@@ -32,6 +32,24 @@ class _V1Span(NamedTuple):
 class Span:
     """Internal V2 Span representation."""
 
+    # A Span is created for every sampled span, so avoid the memory overhead
+    # of a per-instance __dict__.
+    __slots__ = (
+        "trace_id",
+        "name",
+        "parent_id",
+        "span_id",
+        "kind",
+        "timestamp",
+        "duration",
+        "local_endpoint",
+        "remote_endpoint",
+        "debug",
+        "shared",
+        "annotations",
+        "tags",
+    )
+
     def __init__(
         self,
         trace_id: str,
@@ -104,17 +122,22 @@ class Span:
                 "Invalid remote_endpoint value. Must be of type Endpoint."
             )
 
+    def _asdict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
     def __eq__(self, other: object) -> bool:  # pragma: no cover
         """Compare function to help assert span1 == span2 in py3"""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Span):
+            return NotImplemented
+        return self._asdict() == other._asdict()
 
     def __cmp__(self, other: "Span") -> int:  # pragma: no cover
         """Compare function to help assert span1 == span2 in py2"""
-        return self.__dict__ == other.__dict__
+        return self._asdict() == other._asdict()
 
     def __str__(self) -> str:  # pragma: no cover
         """Compare function to nicely print Span rather than just the pointer"""
-        return str(self.__dict__)
+        return str(self._asdict())
 
     def build_v1_span(self) -> _V1Span:
         """Builds and returns a V1 Span.
@@ -122,7 +145,9 @@ class Span:
         :return: newly generated _V1Span
         :rtype: _V1Span
         """
-        annotations: MutableMapping[str, Optional[float]] = OrderedDict([])
+        # Plain dicts keep insertion order too, and are cheaper to build and
+        # update than an OrderedDict.
+        annotations: MutableMapping[str, Optional[float]] = {}
         assert self.timestamp is not None
         if self.kind == Kind.CLIENT:
             assert self.duration is not None
@@ -190,15 +215,18 @@ def create_endpoint(
     ipv6 = None
 
     if host:
-        # Check ipv4 or ipv6.
-        try:
-            socket.inet_pton(socket.AF_INET, host)
-            ipv4 = host
-        except OSError:
-            # If it's not an ipv4 address, maybe it's ipv6.
+        # Only ipv6 addresses contain colons, so there's no need to try
+        # parsing them as ipv4 first and pay for the exception.
+        if ":" in host:
             try:
                 socket.inet_pton(socket.AF_INET6, host)
                 ipv6 = host
+            except OSError:
+                pass
+        else:
+            try:
+                socket.inet_pton(socket.AF_INET, host)
+                ipv4 = host
             except OSError:
                 # If it's neither ipv4 or ipv6, leave both ip addresses unset.
                 pass
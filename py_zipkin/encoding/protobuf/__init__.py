@@ -1,5 +1,5 @@
+import functools
 import socket
-import struct
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -10,10 +10,16 @@ from typing_extensions import TypeGuard
 from py_zipkin.encoding._helpers import Endpoint
 from py_zipkin.encoding._helpers import Span
 from py_zipkin.encoding._types import Kind
-from py_zipkin.util import unsigned_hex_to_signed_int
 
 try:
     from py_zipkin.encoding.protobuf import zipkin_pb2
+
+    _PROTOBUF_KINDS: "Dict[Kind, zipkin_pb2.Span._Kind.ValueType]" = {
+        Kind.CLIENT: zipkin_pb2.Span.CLIENT,
+        Kind.SERVER: zipkin_pb2.Span.SERVER,
+        Kind.PRODUCER: zipkin_pb2.Span.PRODUCER,
+        Kind.CONSUMER: zipkin_pb2.Span.CONSUMER,
+    }
 except ImportError:  # pragma: no cover
     pass
 
@@ -128,22 +134,12 @@ def _hex_to_bytes(hex_id: str) -> bytes:
     :return: binary representation.
     :type: bytes
     """
+    # bytes.fromhex does the whole conversion in C. Left-padding with 0s
+    # makes ids shorter than 16 (or 32) chars decode to 8 (or 16) bytes.
     if len(hex_id) <= 16:
-        int_id = unsigned_hex_to_signed_int(hex_id)
-        return struct.pack(">q", int_id)
+        return bytes.fromhex(hex_id.zfill(16))
     else:
-        # There's no 16-bytes encoding in Python's struct. So we convert the
-        # id as 2 64 bit ids and then concatenate the result.
-
-        # NOTE: we count 16 chars from the right (:-16) rather than the left so
-        # that ids with less than 32 chars will be correctly pre-padded with 0s.
-        high_id = unsigned_hex_to_signed_int(hex_id[:-16])
-        high_bin = struct.pack(">q", high_id)
-
-        low_id = unsigned_hex_to_signed_int(hex_id[-16:])
-        low_bin = struct.pack(">q", low_id)
-
-        return high_bin + low_bin
+        return bytes.fromhex(hex_id.zfill(32))
 
 
 def _get_protobuf_kind(kind: Kind) -> "Optional[zipkin_pb2.Span._Kind.ValueType]":
@@ -154,20 +150,19 @@ def _get_protobuf_kind(kind: Kind) -> "Optional[zipkin_pb2.Span._Kind.ValueType]
     :return: correcponding protobuf's kind value.
     :rtype: zipkin_pb2.Span._Kind.ValueType
     """
-    if kind == Kind.CLIENT:
-        return zipkin_pb2.Span.CLIENT
-    elif kind == Kind.SERVER:
-        return zipkin_pb2.Span.SERVER
-    elif kind == Kind.PRODUCER:
-        return zipkin_pb2.Span.PRODUCER
-    elif kind == Kind.CONSUMER:
-        return zipkin_pb2.Span.CONSUMER
-    return None
+    # Every span goes through this, and a dict lookup is cheaper than
+    # comparing against each Kind in turn. LOCAL has no protobuf equivalent.
+    return _PROTOBUF_KINDS.get(kind)
 
 
+@functools.lru_cache(maxsize=256)
 def _convert_endpoint(endpoint: Endpoint) -> "zipkin_pb2.Endpoint":
     """Converts py_zipkin's Endpoint to Protobuf's Endpoint.
 
+    Most spans share the same few endpoints, so the result is memoized.
+    That's safe because the Span constructor copies the endpoint rather
+    than referencing it, so the cached message is never modified.
+
     :param endpoint: py_zipkins' endpoint to convert.
     :type endpoint: py_zipkin.encoding.Endpoint
     :return: corresponding protobuf's endpoint.
@@ -1,13 +1,16 @@
+import collections
 import os
 import time
 from types import TracebackType
 from typing import Callable
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import Union
 
+from py_zipkin import emitter
 from py_zipkin import Kind
 from py_zipkin.encoding._encoders import get_encoder
 from py_zipkin.encoding._encoders import IEncoder
@@ -52,6 +55,8 @@ class ZipkinLoggingContext:
         firehose_handler: Optional[TransportHandler] = None,
         encoding: Optional[Encoding] = None,
         annotations: Optional[Dict[str, Optional[float]]] = None,
+        emit_in_background: bool = False,
+        max_span_batch_bytes: Optional[int] = None,
     ):
         self.zipkin_attrs = zipkin_attrs
         self.endpoint = endpoint
@@ -61,17 +66,39 @@ class ZipkinLoggingContext:
         self._get_tracer = get_tracer
         self.service_name = service_name
         self.report_root_timestamp = report_root_timestamp
-        self.tags = binary_annotations or {}
+        self._tags = binary_annotations or {}
+        # Tags can be added from any thread while the root span is active.
+        # Appending to a deque is atomic, so writers only queue their tags
+        # and they get merged into the dict when it's read.
+        self._pending_tags: Deque[Dict[str, Optional[str]]] = collections.deque()
         self.add_logging_annotation = add_logging_annotation
         self.client_context = client_context
         self.max_span_batch_size = max_span_batch_size
+        self.max_span_batch_bytes = max_span_batch_bytes
         self.firehose_handler = firehose_handler
         self.annotations = annotations or {}
+        self.emit_in_background = emit_in_background
 
         self.remote_endpoint: Optional[Endpoint] = None
         assert encoding is not None
         self.encoder = get_encoder(encoding)
 
+    @property
+    def tags(self) -> Dict[str, Optional[str]]:
+        pending_tags = self._pending_tags
+        while pending_tags:
+            self._tags.update(pending_tags.popleft())
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Dict[str, Optional[str]]) -> None:
+        self._pending_tags.clear()
+        self._tags = tags
+
+    def update_tags(self, extra_tags: Dict[str, Optional[str]]) -> None:
+        """Adds tags to the root span. Safe to call from any thread."""
+        self._pending_tags.append(extra_tags)
+
     def start(self) -> "ZipkinLoggingContext":
         """Actions to be taken before request is handled."""
 
@@ -96,7 +123,10 @@ class ZipkinLoggingContext:
             # FIXME: We need to allow different batching settings per handler
             self._emit_spans_with_span_sender(
                 ZipkinBatchSender(
-                    self.firehose_handler, self.max_span_batch_size, self.encoder
+                    self.firehose_handler,
+                    self.max_span_batch_size,
+                    self.encoder,
+                    self.max_span_batch_bytes,
                 )
             )
 
@@ -105,45 +135,64 @@ class ZipkinLoggingContext:
             return
 
         span_sender = ZipkinBatchSender(
-            self.transport_handler, self.max_span_batch_size, self.encoder
+            self.transport_handler,
+            self.max_span_batch_size,
+            self.encoder,
+            self.max_span_batch_bytes,
         )
 
         self._emit_spans_with_span_sender(span_sender)
         self._get_tracer().clear()
 
     def _emit_spans_with_span_sender(self, span_sender: "ZipkinBatchSender") -> None:
-        with span_sender:
-            end_timestamp = time.time()
-
-            # Collect, annotate, and log client spans from the logging handler
-            for span in self._get_tracer()._span_storage:
-                assert span.local_endpoint is not None
-                span.local_endpoint = copy_endpoint_with_new_service_name(
-                    self.endpoint,
-                    span.local_endpoint.service_name,
-                )
-
-                span_sender.add_span(span)
-
-            if self.add_logging_annotation:
-                self.annotations[LOGGING_END_KEY] = time.time()
-
-            span_sender.add_span(
-                Span(
-                    trace_id=self.zipkin_attrs.trace_id,
-                    name=self.span_name,
-                    parent_id=self.zipkin_attrs.parent_span_id,
-                    span_id=self.zipkin_attrs.span_id,
-                    kind=Kind.CLIENT if self.client_context else Kind.SERVER,
-                    timestamp=self.start_timestamp,
-                    duration=end_timestamp - self.start_timestamp,
-                    local_endpoint=self.endpoint,
-                    remote_endpoint=self.remote_endpoint,
-                    shared=not self.report_root_timestamp,
-                    annotations=self.annotations,
-                    tags=self.tags,
+        spans = self._collect_spans()
+        if self.emit_in_background:
+            emitter.submit(spans, span_sender)
+        else:
+            span_sender.send(spans)
+
+    def _collect_spans(self) -> List[Span]:
+        """Returns the child spans stored in the tracer plus the root span."""
+        end_timestamp = time.time()
+        spans = []
+
+        # Child spans mostly share a handful of service names, and Endpoints
+        # are immutable, so only build one local endpoint per service name.
+        local_endpoints: Dict[Optional[str], Endpoint] = {}
+
+        # Collect and annotate client spans from the logging handler
+        for span in self._get_tracer()._span_storage:
+            assert span.local_endpoint is not None
+            service_name = span.local_endpoint.service_name
+            local_endpoint = local_endpoints.get(service_name)
+            if local_endpoint is None:
+                local_endpoint = copy_endpoint_with_new_service_name(
+                    self.endpoint, service_name
                 )
+                local_endpoints[service_name] = local_endpoint
+            span.local_endpoint = local_endpoint
+            spans.append(span)
+
+        if self.add_logging_annotation:
+            self.annotations[LOGGING_END_KEY] = time.time()
+
+        spans.append(
+            Span(
+                trace_id=self.zipkin_attrs.trace_id,
+                name=self.span_name,
+                parent_id=self.zipkin_attrs.parent_span_id,
+                span_id=self.zipkin_attrs.span_id,
+                kind=Kind.CLIENT if self.client_context else Kind.SERVER,
+                timestamp=self.start_timestamp,
+                duration=end_timestamp - self.start_timestamp,
+                local_endpoint=self.endpoint,
+                remote_endpoint=self.remote_endpoint,
+                shared=not self.report_root_timestamp,
+                annotations=self.annotations,
+                tags=self.tags,
             )
+        )
+        return spans
 
 
 class ZipkinBatchSender:
@@ -155,15 +204,22 @@ class ZipkinBatchSender:
         transport_handler: Optional[TransportHandler],
         max_portion_size: Optional[int],
         encoder: IEncoder,
+        max_payload_bytes: Optional[int] = None,
     ) -> None:
         self.transport_handler = transport_handler
         self.max_portion_size = max_portion_size or self.MAX_PORTION_SIZE
         self.encoder = encoder
 
+        # Use the strictest limit between the one requested by the caller
+        # and the one supported by the transport.
+        self.max_payload_bytes = max_payload_bytes
         if isinstance(self.transport_handler, BaseTransportHandler):
-            self.max_payload_bytes = self.transport_handler.get_max_payload_bytes()
-        else:
-            self.max_payload_bytes = None
+            transport_max_bytes = self.transport_handler.get_max_payload_bytes()
+            if transport_max_bytes is not None and (
+                self.max_payload_bytes is None
+                or transport_max_bytes < self.max_payload_bytes
+            ):
+                self.max_payload_bytes = transport_max_bytes
 
     def __enter__(self) -> "ZipkinBatchSender":
         self._reset_queue()
@@ -194,6 +250,12 @@ class ZipkinBatchSender:
         self.queue: List[Union[str, bytes]] = []
         self.current_size = 0
 
+    def send(self, spans: List[Span]) -> None:
+        """Encodes and sends all the spans, flushing the last batch."""
+        with self:
+            for span in spans:
+                self.add_span(span)
+
     def add_span(self, internal_span: Span) -> None:
         encoded_span = self.encoder.encode_span(internal_span)
 
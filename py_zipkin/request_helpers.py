@@ -1,9 +1,11 @@
 import logging
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 
 from typing_extensions import TypedDict
 
+from py_zipkin.sampler import BaseSampler
 from py_zipkin.storage import get_default_tracer
 from py_zipkin.storage import Stack
 from py_zipkin.storage import Tracer
@@ -14,6 +16,14 @@ from py_zipkin.util import ZipkinAttrs
 
 log = logging.getLogger(__name__)
 
+HeaderItems = Tuple[Tuple[str, Optional[str]], ...]
+
+# Header pairs that don't depend on the span ids, shared by every call to
+# create_http_header_items.
+_FLAGS_HEADER_ITEM = ("X-B3-Flags", "0")
+_SAMPLED_HEADER_ITEM = ("X-B3-Sampled", "1")
+_NOT_SAMPLED_HEADER_ITEM = ("X-B3-Sampled", "0")
+
 
 class B3JSON(TypedDict):
     trace_id: Optional[str]
@@ -117,6 +127,7 @@ def extract_zipkin_attrs_from_headers(
     headers: Dict[str, str],
     sample_rate: float = 100.0,
     use_128bit_trace_id: bool = False,
+    sampler: Optional[BaseSampler] = None,
 ) -> Optional[ZipkinAttrs]:
     """
     Implements extraction of B3 headers per:
@@ -125,6 +136,9 @@ def extract_zipkin_attrs_from_headers(
     The input headers can be any dict-like container that supports "in"
     membership test and a .get() method that accepts a default value.
 
+    If the headers defer the sampling decision, it's made by `sampler` using
+    `sample_rate`, or at random if no sampler is given.
+
     Returns a ZipkinAttrs instance or None
     """
     try:
@@ -160,7 +174,10 @@ def extract_zipkin_attrs_from_headers(
     else:
         # sample flag missing; means "Defer" and we're responsible for
         # rolling fresh dice
-        is_sampled = _should_sample(sample_rate)
+        if sampler is not None:
+            is_sampled = sampler.should_sample(parsed["trace_id"], sample_rate)
+        else:
+            is_sampled = _should_sample(sample_rate)
 
     return ZipkinAttrs(
         parsed["trace_id"],
@@ -171,6 +188,17 @@ def extract_zipkin_attrs_from_headers(
     )
 
 
+def _get_current_zipkin_attrs(
+    context_stack: Optional[Stack], tracer: Optional[Tracer]
+) -> Optional[ZipkinAttrs]:
+    if tracer:
+        return tracer.get_zipkin_attrs()
+    elif context_stack:
+        return context_stack.get()
+    else:
+        return get_default_tracer().get_zipkin_attrs()
+
+
 def create_http_headers(
     context_stack: Optional[Stack] = None,
     tracer: Optional[Tracer] = None,
@@ -187,12 +215,7 @@ def create_http_headers(
     :returns: dict containing (X-B3-TraceId, X-B3-SpanId, X-B3-ParentSpanId,
                 X-B3-Flags and X-B3-Sampled) keys OR an empty dict.
     """
-    if tracer:
-        zipkin_attrs = tracer.get_zipkin_attrs()
-    elif context_stack:
-        zipkin_attrs = context_stack.get()
-    else:
-        zipkin_attrs = get_default_tracer().get_zipkin_attrs()
+    zipkin_attrs = _get_current_zipkin_attrs(context_stack, tracer)
 
     # If zipkin_attrs is still not set then we're not in a trace context
     if not zipkin_attrs:
@@ -212,3 +235,41 @@ def create_http_headers(
         "X-B3-Flags": "0",
         "X-B3-Sampled": "1" if zipkin_attrs.is_sampled else "0",
     }
+
+
+def create_http_header_items(
+    context_stack: Optional[Stack] = None,
+    tracer: Optional[Tracer] = None,
+    new_span_id: bool = False,
+) -> HeaderItems:
+    """
+    Same as create_http_headers, but returns the headers as a tuple of
+    (name, value) pairs rather than a dict.
+
+    Most HTTP clients accept or iterate over header pairs, so this saves
+    building a dict just to iterate over it.
+
+    :returns: tuple of (name, value) pairs for the X-B3-TraceId, X-B3-SpanId,
+                X-B3-ParentSpanId, X-B3-Flags and X-B3-Sampled headers OR
+                an empty tuple.
+    """
+    zipkin_attrs = _get_current_zipkin_attrs(context_stack, tracer)
+
+    # If zipkin_attrs is still not set then we're not in a trace context
+    if not zipkin_attrs:
+        return ()
+
+    if new_span_id:
+        span_id: Optional[str] = generate_random_64bit_string()
+        parent_span_id = zipkin_attrs.span_id
+    else:
+        span_id = zipkin_attrs.span_id
+        parent_span_id = zipkin_attrs.parent_span_id
+
+    return (
+        ("X-B3-TraceId", zipkin_attrs.trace_id),
+        ("X-B3-SpanId", span_id),
+        ("X-B3-ParentSpanId", parent_span_id),
+        _FLAGS_HEADER_ITEM,
+        _SAMPLED_HEADER_ITEM if zipkin_attrs.is_sampled else _NOT_SAMPLED_HEADER_ITEM,
+    )
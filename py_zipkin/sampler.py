@@ -0,0 +1,60 @@
+from py_zipkin.util import _should_sample
+
+# The lowest 64 bits of a trace id are random (128-bit trace ids only have
+# a timestamp in their upper 32 bits), so they're used as a uniformly
+# distributed number in [0, 2**64).
+_TRACE_ID_RANGE = float(2**64)
+
+
+class BaseSampler:
+    def should_sample(
+        self, trace_id: str, sample_rate: float
+    ) -> bool:  # pragma: no cover
+        """Decides whether a new trace should be sampled.
+
+        This is only called by local root spans that have a sample_rate, when
+        they start a new trace or re-roll the sampling decision of an
+        unsampled one.
+
+        :param trace_id: hex-encoded trace id of the trace.
+        :type trace_id: str
+        :param sample_rate: sample_rate of the root span, 0.0 - 100.0.
+        :type sample_rate: float
+        :returns: whether the trace should be sampled.
+        :rtype: bool
+        """
+        raise NotImplementedError("should_sample is not implemented")
+
+
+class RandomSampler(BaseSampler):
+    """Samples each trace at random. This is the default behavior."""
+
+    def should_sample(self, trace_id: str, sample_rate: float) -> bool:
+        return _should_sample(sample_rate)
+
+
+class TraceIdSampler(BaseSampler):
+    """Samples traces based on their trace id.
+
+    The decision only depends on the trace id and the sample rate, so
+    services that use this sampler with the same sample_rate make the same
+    decision for a given trace, and services with a higher sample_rate
+    sample a superset of the traces sampled by the ones with a lower rate.
+    That only holds where the sampler is used: pass it to
+    extract_zipkin_attrs_from_headers as well for traces whose sampling
+    decision was deferred upstream. Trace ids that aren't valid hex are
+    sampled at random.
+    """
+
+    def should_sample(self, trace_id: str, sample_rate: float) -> bool:
+        if sample_rate == 0.0:
+            return False
+        elif sample_rate == 100.0:
+            return True
+        try:
+            trace_id_value = int(trace_id[-16:], 16)
+        except ValueError:
+            # Trace ids from upstream headers aren't validated, so fall back
+            # to a random decision rather than failing the request.
+            return _should_sample(sample_rate)
+        return trace_id_value < sample_rate / 100.0 * _TRACE_ID_RANGE
@@ -37,9 +37,11 @@ def _get_thread_local_tracer() -> "Tracer":
     :returns: current tracer.
     :rtype: Tracer
     """
-    if not hasattr(_thread_local_tracer, "tracer"):
+    try:
+        return _thread_local_tracer.tracer
+    except AttributeError:
         _thread_local_tracer.tracer = Tracer()
-    return _thread_local_tracer.tracer
+        return _thread_local_tracer.tracer
 
 
 def _set_thread_local_tracer(tracer: "Tracer") -> None:
@@ -137,37 +139,27 @@ class Stack:
     """
 
     def __init__(self, storage: Optional[List[ZipkinAttrs]] = None) -> None:
+        # _storage is a plain attribute rather than a property so that push,
+        # pop and get, which run for every span, only need a single lookup.
         if storage is not None:
             log.warning("Passing a storage object to Stack is deprecated.")
-            self.__storage: List[ZipkinAttrs] = storage
+            self._storage: List[ZipkinAttrs] = storage
         else:
-            self.__storage = []
-
-    # this pattern is currently necessary due to
-    # https://github.com/python/mypy/issues/4125
-    @property
-    def _storage(self) -> List[ZipkinAttrs]:
-        return self.__storage
-
-    @_storage.setter
-    def _storage(self, value: List[ZipkinAttrs]) -> None:  # pragma: no cover
-        self.__storage = value
-
-    @_storage.deleter
-    def _storage(self) -> None:  # pragma: no cover
-        del self.__storage
+            self._storage = []
 
     def push(self, item: ZipkinAttrs) -> None:
         self._storage.append(item)
 
     def pop(self) -> Optional[ZipkinAttrs]:
-        if self._storage:
-            return self._storage.pop()
+        storage = self._storage
+        if storage:
+            return storage.pop()
         return None
 
     def get(self) -> Optional[ZipkinAttrs]:
-        if self._storage:
-            return self._storage[-1]
+        storage = self._storage
+        if storage:
+            return storage[-1]
         return None
 
     def copy(self) -> "Stack":
@@ -252,7 +244,12 @@ def get_default_tracer() -> Tracer:
     :rtype: Tracer
     """
     if _contextvars_tracer:
-        return _get_contextvars_tracer()
+        # This runs several times for every span, so check for an existing
+        # tracer here rather than always calling _get_contextvars_tracer.
+        try:
+            return _contextvars_tracer.get()
+        except LookupError:
+            return _get_contextvars_tracer()
 
     return _get_thread_local_tracer()
 
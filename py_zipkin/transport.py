@@ -1,8 +1,11 @@
+import threading
+from http.client import HTTPConnection
+from http.client import HTTPResponse
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 from typing import Union
-from urllib.request import Request
-from urllib.request import urlopen
+from urllib.error import HTTPError
 
 from py_zipkin.encoding import detect_span_version_and_encoding
 from py_zipkin.encoding import Encoding
@@ -48,12 +51,18 @@ class UnknownEncoding(Exception):
 
 
 class SimpleHTTPTransport(BaseTransportHandler):
-    def __init__(self, address: str, port: int) -> None:
+    def __init__(
+        self, address: str, port: int, timeout: Optional[float] = 10.0
+    ) -> None:
         """A simple HTTP transport for zipkin.
 
         This is not production ready (not async, no retries) but
         it's helpful for tests or people trying out py-zipkin.
 
+        Each thread keeps its connection to the server open and reuses it
+        between payloads, reopening it if the server has closed it in the
+        meantime.
+
         .. code-block:: python
 
             with zipkin_span(
@@ -69,10 +78,18 @@ class SimpleHTTPTransport(BaseTransportHandler):
         :type address: str
         :param port: zipkin server port.
         :type port: int
+        :param timeout: max number of seconds to wait for the server when
+            connecting or sending a payload. Waits forever if None.
+        :type timeout: float
         """
         super().__init__()
         self.address = address
         self.port = port
+        self.timeout = timeout
+        # An HTTPConnection can only handle one request at a time, and the
+        # transport may be shared by the threads emitting their traces, so
+        # each thread gets its own.
+        self._local = threading.local()
 
     def get_max_payload_bytes(self) -> Optional[int]:
         return None
@@ -106,9 +123,36 @@ class SimpleHTTPTransport(BaseTransportHandler):
             payload.encode("utf-8") if isinstance(payload, str) else payload
         )
         path, content_type = self._get_path_content_type(encoded_payload)
-        url = f"http://{self.address}:{self.port}{path}"
-
-        req = Request(url, encoded_payload, {"Content-Type": content_type})
-        response = urlopen(req)
-
-        assert response.getcode() == 202
+        headers = {"Content-Type": content_type}
+
+        try:
+            response = self._post(path, encoded_payload, headers)
+        except ConnectionError:
+            # The server closes idle keep-alive connections. That's only
+            # noticed when sending, so retry once on a new connection.
+            response = self._post(path, encoded_payload, headers)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(
+                f"http://{self.address}:{self.port}{path}",
+                response.status,
+                response.reason,
+                response.headers,
+                None,
+            )
+
+    def _post(self, path: str, body: bytes, headers: Dict[str, str]) -> HTTPResponse:
+        connection: Optional[HTTPConnection] = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = HTTPConnection(self.address, self.port, timeout=self.timeout)
+            self._local.connection = connection
+        try:
+            connection.request("POST", path, body, headers)
+            response = connection.getresponse()
+            # The response has to be fully read before reusing the connection.
+            response.read()
+        except Exception:
+            connection.close()
+            self._local.connection = None
+            raise
+        return response
@@ -1,8 +1,15 @@
+import os
 import random
 import struct
+import threading
 import time
+from typing import List
 from typing import NamedTuple
 from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from py_zipkin.sampler import BaseSampler
 
 
 class ZipkinAttrs(NamedTuple):
@@ -23,6 +30,41 @@ class ZipkinAttrs(NamedTuple):
     is_sampled: bool
 
 
+# The module-level functions of `random` all share a single generator, so each
+# thread gets its own instance instead to avoid contending on it.
+_thread_local = threading.local()
+
+# Number of 64-bit ids generated at once by generate_random_64bit_string.
+_ID_POOL_SIZE = 64
+
+
+def _get_random() -> random.Random:
+    try:
+        return _thread_local.random
+    except AttributeError:
+        _thread_local.random = random.Random()
+        return _thread_local.random
+
+
+def _get_id_pool() -> List[str]:
+    try:
+        return _thread_local.id_pool
+    except AttributeError:
+        _thread_local.id_pool = []
+        return _thread_local.id_pool
+
+
+def _reset_random() -> None:
+    # A forked child inherits its parent's generator state and pending ids,
+    # which would make both processes generate the same ids.
+    global _thread_local
+    _thread_local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_random)
+
+
 def generate_random_64bit_string() -> str:
     """Returns a 64 bit UTF-8 encoded string. In the interests of simplicity,
     this is always cast to a `str` instead of (in py2 land) a unicode string.
@@ -30,7 +72,22 @@ def generate_random_64bit_string() -> str:
 
     :returns: random 16-character string
     """
-    return f"{random.getrandbits(64):016x}"
+    # This runs several times for every span, so avoid the extra function
+    # call to _get_id_pool() when there are ids left.
+    try:
+        return _thread_local.id_pool.pop()
+    except (AttributeError, IndexError):
+        pass
+
+    # Out of ids: generating the random bits and formatting them for a whole
+    # batch of ids at once is cheaper than doing it for every single id.
+    id_pool = _get_id_pool()
+    bits = _get_random().getrandbits(64 * _ID_POOL_SIZE)
+    hex_ids = f"{bits:0{16 * _ID_POOL_SIZE}x}"
+    id_pool.extend(
+        hex_ids[i : i + 16] for i in range(0, len(hex_ids), 16)  # noqa: E203
+    )
+    return id_pool.pop()
 
 
 def generate_random_128bit_string() -> str:
@@ -44,7 +101,7 @@ def generate_random_128bit_string() -> str:
     :returns: 32-character hex string
     """
     t = int(time.time())
-    lower_96 = random.getrandbits(96)
+    lower_96 = _get_random().getrandbits(96)
     return f"{(t << 96) | lower_96:032x}"
 
 
@@ -84,7 +141,7 @@ def _should_sample(sample_rate: float) -> bool:
         return False  # save a die roll
     elif sample_rate == 100.0:
         return True  # ditto
-    return (random.random() * 100) < sample_rate
+    return (_get_random().random() * 100) < sample_rate
 
 
 def create_attrs_for_span(
@@ -93,6 +150,7 @@ def create_attrs_for_span(
     span_id: Optional[str] = None,
     use_128bit_trace_id: bool = False,
     flags: Optional[str] = None,
+    sampler: Optional["BaseSampler"] = None,
 ) -> ZipkinAttrs:
     """Creates a set of zipkin attributes for a span.
 
@@ -106,6 +164,9 @@ def create_attrs_for_span(
     :type span_id: str
     :param use_128bit_trace_id: If true, generate 128-bit trace_ids
     :type use_128bit_trace_id: bool
+    :param sampler: Optional sampler making the sampling decision. Traces
+                    are sampled at random if this is None.
+    :type sampler: py_zipkin.sampler.BaseSampler
     """
     # Calculate if this trace is sampled based on the sample rate
     if trace_id is None:
@@ -115,12 +176,9 @@ def create_attrs_for_span(
             trace_id = generate_random_64bit_string()
     if span_id is None:
         span_id = generate_random_64bit_string()
-    is_sampled = _should_sample(sample_rate)
-
-    return ZipkinAttrs(
-        trace_id=trace_id,
-        span_id=span_id,
-        parent_span_id=None,
-        flags=flags or "0",
-        is_sampled=is_sampled,
-    )
+    if sampler is not None:
+        is_sampled = sampler.should_sample(trace_id, sample_rate)
+    else:
+        is_sampled = _should_sample(sample_rate)
+
+    return ZipkinAttrs(trace_id, span_id, None, flags or "0", is_sampled)
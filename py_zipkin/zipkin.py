@@ -1,5 +1,6 @@
 import functools
 import logging
+import sys
 import time
 from types import TracebackType
 from typing import Any
@@ -20,7 +21,10 @@ from py_zipkin.encoding._helpers import Span
 from py_zipkin.exception import ZipkinError
 from py_zipkin.logging_helper import TransportHandler
 from py_zipkin.logging_helper import ZipkinLoggingContext
+from py_zipkin.request_helpers import create_http_header_items
 from py_zipkin.request_helpers import create_http_headers
+from py_zipkin.request_helpers import HeaderItems
+from py_zipkin.sampler import BaseSampler
 from py_zipkin.storage import get_default_tracer
 from py_zipkin.storage import SpanStorage
 from py_zipkin.storage import Stack
@@ -33,10 +37,30 @@ log = logging.getLogger(__name__)
 
 ERROR_KEY = "error"
 
+# The deprecated `include` argument only matters through whether it contains
+# 'client' and/or 'server', so it's reduced to a 2-bit mask which indexes
+# directly into the corresponding Kind.
+_INCLUDE_CLIENT = 0b01
+_INCLUDE_SERVER = 0b10
+_KIND_BY_INCLUDE_MASK = (Kind.LOCAL, Kind.CLIENT, Kind.SERVER, Kind.LOCAL)
+
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+@functools.lru_cache(maxsize=256)
+def _create_endpoint_cached(
+    port: int, service_name: str, host: Optional[str]
+) -> Endpoint:
+    """Memoized create_endpoint.
+
+    Services keep creating spans with the same port, service name and host,
+    and resolving the default host means a gethostbyname call. Endpoints are
+    immutable so the same instance can safely be shared between spans.
+    """
+    return create_endpoint(port, service_name, host)
+
+
 class zipkin_span:
     """Context manager/decorator for all of your zipkin tracing needs.
 
@@ -94,6 +118,43 @@ class zipkin_span:
             do_stuff()
     """
 
+    # zipkin_span is created for every single span, so avoid the memory
+    # overhead of a per-instance __dict__.
+    __slots__ = (
+        "service_name",
+        "span_name",
+        "zipkin_attrs_override",
+        "transport_handler",
+        "max_span_batch_size",
+        "max_span_batch_bytes",
+        "_annotations",
+        "_binary_annotations",
+        "port",
+        "sample_rate",
+        "add_logging_annotation",
+        "report_root_timestamp_override",
+        "use_128bit_trace_id",
+        "host",
+        "_context_stack",
+        "_span_storage",
+        "firehose_handler",
+        "kind",
+        "timestamp",
+        "duration",
+        "encoding",
+        "emit_in_background",
+        "sampler",
+        "_tracer",
+        "_is_local_root_span",
+        "logging_context",
+        "do_pop_attrs",
+        "remote_endpoint",
+        "zipkin_attrs",
+        "start_timestamp",
+        "_start_counter",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         service_name: str,
@@ -117,6 +178,9 @@ class zipkin_span:
         timestamp: Optional[float] = None,
         duration: Optional[float] = None,
         encoding: Encoding = Encoding.V2_JSON,
+        emit_in_background: bool = False,
+        max_span_batch_bytes: Optional[int] = None,
+        sampler: Optional[BaseSampler] = None,
         _tracer: Optional[Tracer] = None,
     ):
         """Logs a zipkin span. If this is the root span, then a zipkin
@@ -188,6 +252,17 @@ class zipkin_span:
         :type duration: float
         :param encoding: Output encoding format, defaults to V2_JSON spans.
         :type encoding: Encoding
+        :param emit_in_background: If true, spans are encoded and sent to the
+            transport by a background thread rather than when the root span
+            exits. Use `py_zipkin.emitter.flush` to wait for them to be sent.
+        :type emit_in_background: boolean
+        :param max_span_batch_bytes: Optional max size in bytes of one batch.
+            If the transport defines get_max_payload_bytes, the smallest of
+            the two values is used. Defaults to no limit.
+        :type max_span_batch_bytes: int
+        :param sampler: Makes the sampling decision for traces started by
+            this span, according to sample_rate. Defaults to sampling at random.
+        :type sampler: py_zipkin.sampler.BaseSampler
         :param _tracer: Current tracer object. This argument is passed in
             automatically when you create a zipkin_span from a Tracer.
         :type _tracer: Tracer
@@ -197,8 +272,11 @@ class zipkin_span:
         self.zipkin_attrs_override = zipkin_attrs
         self.transport_handler = transport_handler
         self.max_span_batch_size = max_span_batch_size
-        self.annotations = annotations or {}
-        self.binary_annotations = binary_annotations or {}
+        self.max_span_batch_bytes = max_span_batch_bytes
+        # Most spans never get any annotations, so the dicts are only
+        # created when they're first accessed.
+        self._annotations = annotations or None
+        self._binary_annotations = binary_annotations or None
         self.port = port
         self.sample_rate = sample_rate
         self.add_logging_annotation = add_logging_annotation
@@ -212,53 +290,36 @@ class zipkin_span:
         self.timestamp = timestamp
         self.duration = duration
         self.encoding = encoding
+        self.emit_in_background = emit_in_background
+        self.sampler = sampler
         self._tracer = _tracer
 
-        self._is_local_root_span = False
-        self.logging_context: Optional[ZipkinLoggingContext] = None
-        self.do_pop_attrs = False
-        # Spans that log a 'cs' timestamp can additionally record a
-        # 'sa' binary annotation that shows where the request is going.
-        self.remote_endpoint: Optional[Endpoint] = None
-        self.zipkin_attrs: Optional[ZipkinAttrs] = None
-
         # It used to  be possible to override timestamp and duration by passing
         # in the cs/cr or sr/ss annotations. We want to keep backward compatibility
         # for now, so this logic overrides self.timestamp and self.duration in the
         # same way.
         # This doesn't fit well with v2 spans since those annotations are gone, so
         # we also log a deprecation warning.
-        if "sr" in self.annotations and "ss" in self.annotations:
-            assert self.annotations["ss"] is not None
-            assert self.annotations["sr"] is not None
-            self.duration = self.annotations["ss"] - self.annotations["sr"]
-            self.timestamp = self.annotations["sr"]
+        if annotations and "sr" in annotations and "ss" in annotations:
+            assert annotations["ss"] is not None
+            assert annotations["sr"] is not None
+            self.duration = annotations["ss"] - annotations["sr"]
+            self.timestamp = annotations["sr"]
             log.warning(
                 "Manually setting 'sr'/'ss' annotations is deprecated. Please "
                 "use the timestamp and duration parameters."
             )
-        if "cr" in self.annotations and "cs" in self.annotations:
-            assert self.annotations["cr"] is not None
-            assert self.annotations["cs"] is not None
-            self.duration = self.annotations["cr"] - self.annotations["cs"]
-            self.timestamp = self.annotations["cs"]
+        if annotations and "cr" in annotations and "cs" in annotations:
+            assert annotations["cr"] is not None
+            assert annotations["cs"] is not None
+            self.duration = annotations["cr"] - annotations["cs"]
+            self.timestamp = annotations["cs"]
             log.warning(
                 "Manually setting 'cr'/'cs' annotations is deprecated. Please "
                 "use the timestamp and duration parameters."
             )
 
-        # Root spans have transport_handler and at least one of
-        # zipkin_attrs_override or sample_rate.
-        if self.zipkin_attrs_override or self.sample_rate is not None:
-            # transport_handler is mandatory for root spans
-            if self.transport_handler is None:
-                raise ZipkinError("Root spans require a transport handler to be given")
-
-            self._is_local_root_span = True
-
-        # If firehose_handler than this is a local root span.
-        if self.firehose_handler:
-            self._is_local_root_span = True
+        self._init_span_state()
 
         if self.sample_rate is not None and not (0.0 <= self.sample_rate <= 100.0):
             raise ZipkinError("Sample rate must be between 0.0 and 100.0")
@@ -278,37 +339,149 @@ class zipkin_span:
             log.warning("context_stack is deprecated. Set local_storage instead.")
             self.get_tracer()._context_stack = self._context_stack
 
+    def _init_span_state(self) -> None:
+        """Sets up the attributes that aren't constructor arguments: whether
+        this is a local root span, and the ones filled in by start().
+
+        Shared by __init__ and _copy_for_call, which skips __init__.
+        """
+        self._is_local_root_span = False
+        # Root spans have transport_handler and at least one of
+        # zipkin_attrs_override or sample_rate.
+        if self.zipkin_attrs_override or self.sample_rate is not None:
+            # transport_handler is mandatory for root spans
+            if self.transport_handler is None:
+                raise ZipkinError("Root spans require a transport handler to be given")
+
+            self._is_local_root_span = True
+
+        # If firehose_handler than this is a local root span.
+        if self.firehose_handler:
+            self._is_local_root_span = True
+
+        self.logging_context: Optional[ZipkinLoggingContext] = None
+        self.do_pop_attrs = False
+        # Spans that log a 'cs' timestamp can additionally record a
+        # 'sa' binary annotation that shows where the request is going.
+        self.remote_endpoint: Optional[Endpoint] = None
+        self.zipkin_attrs: Optional[ZipkinAttrs] = None
+
+    @property
+    def annotations(self) -> Dict[str, Optional[float]]:
+        if self._annotations is None:
+            self._annotations = {}
+        return self._annotations
+
+    @annotations.setter
+    def annotations(self, value: Dict[str, Optional[float]]) -> None:
+        self._annotations = value
+
+    @property
+    def binary_annotations(self) -> Dict[str, Optional[str]]:
+        if self._binary_annotations is None:
+            self._binary_annotations = {}
+        return self._binary_annotations
+
+    @binary_annotations.setter
+    def binary_annotations(self, value: Dict[str, Optional[str]]) -> None:
+        self._binary_annotations = value
+
     def __call__(self, f: F) -> F:
         @functools.wraps(f)
         def decorated(*args: Any, **kwargs: Any) -> Any:
-            with zipkin_span(
-                service_name=self.service_name,
-                span_name=self.span_name,
-                zipkin_attrs=self.zipkin_attrs,
-                transport_handler=self.transport_handler,
-                max_span_batch_size=self.max_span_batch_size,
-                annotations=self.annotations,
-                binary_annotations=self.binary_annotations,
-                port=self.port,
-                sample_rate=self.sample_rate,
-                include=None,
-                add_logging_annotation=self.add_logging_annotation,
-                report_root_timestamp=self.report_root_timestamp_override,
-                use_128bit_trace_id=self.use_128bit_trace_id,
-                host=self.host,
-                context_stack=self._context_stack,
-                span_storage=self._span_storage,
-                firehose_handler=self.firehose_handler,
-                kind=self.kind,
-                timestamp=self.timestamp,
-                duration=self.duration,
-                encoding=self.encoding,
-                _tracer=self._tracer,
-            ):
-                return f(*args, **kwargs)
+            # Same as `with self._new_span_for_call():`, minus the __enter__
+            # and __exit__ indirection on every call.
+            span = self._new_span_for_call()
+            span.start()
+            try:
+                result = f(*args, **kwargs)
+            except BaseException:
+                span.stop(*sys.exc_info())
+                raise
+            span.stop()
+            return result
 
         return cast(F, decorated)
 
+    def _new_span_for_call(self) -> "zipkin_span":
+        """Creates the span for one call of a function decorated with this
+        span. Everything is looked up at call time, as it was when each call
+        simply built a new zipkin_span.
+        """
+        # The decorator arguments were already validated when this span was
+        # created, so unless the deprecated storage arguments need to be
+        # re-applied to the current tracer, each call can skip __init__.
+        # User subclasses may set up their own attributes in __init__, so
+        # they can't skip it.
+        if (
+            type(self) in (zipkin_span, zipkin_client_span, zipkin_server_span)
+            and self._span_storage is None
+            and self._context_stack is None
+        ):
+            return self._copy_for_call()
+        return zipkin_span(
+            service_name=self.service_name,
+            span_name=self.span_name,
+            zipkin_attrs=self.zipkin_attrs,
+            transport_handler=self.transport_handler,
+            max_span_batch_size=self.max_span_batch_size,
+            max_span_batch_bytes=self.max_span_batch_bytes,
+            annotations=self._annotations,
+            binary_annotations=self._binary_annotations,
+            port=self.port,
+            sample_rate=self.sample_rate,
+            include=None,
+            add_logging_annotation=self.add_logging_annotation,
+            report_root_timestamp=self.report_root_timestamp_override,
+            use_128bit_trace_id=self.use_128bit_trace_id,
+            host=self.host,
+            context_stack=self._context_stack,
+            span_storage=self._span_storage,
+            firehose_handler=self.firehose_handler,
+            kind=self.kind,
+            timestamp=self.timestamp,
+            duration=self.duration,
+            encoding=self.encoding,
+            emit_in_background=self.emit_in_background,
+            sampler=self.sampler,
+            _tracer=self._tracer,
+        )
+
+    def _copy_for_call(self) -> "zipkin_span":
+        """Creates a fresh span with the same arguments as this one, without
+        going through __init__ and its validation.
+
+        This is the same as calling zipkin_span() with this span's
+        attributes, which is what the decorator used to do for every call.
+        """
+        span = object.__new__(type(self))
+        span.service_name = self.service_name
+        span.span_name = self.span_name
+        span.zipkin_attrs_override = self.zipkin_attrs
+        span.transport_handler = self.transport_handler
+        span.max_span_batch_size = self.max_span_batch_size
+        span.max_span_batch_bytes = self.max_span_batch_bytes
+        span._annotations = self._annotations or None
+        span._binary_annotations = self._binary_annotations or None
+        span.port = self.port
+        span.sample_rate = self.sample_rate
+        span.add_logging_annotation = self.add_logging_annotation
+        span.report_root_timestamp_override = self.report_root_timestamp_override
+        span.use_128bit_trace_id = self.use_128bit_trace_id
+        span.host = self.host
+        span._context_stack = None
+        span._span_storage = None
+        span.firehose_handler = self.firehose_handler
+        span.kind = self.kind
+        span.timestamp = self.timestamp
+        span.duration = self.duration
+        span.encoding = self.encoding
+        span.emit_in_background = self.emit_in_background
+        span.sampler = self.sampler
+        span._tracer = self._tracer
+        span._init_span_state()
+        return span
+
     def get_tracer(self) -> Tracer:
         if self._tracer is not None:
             return self._tracer
@@ -331,12 +504,12 @@ class zipkin_span:
                 # If neither or both are present, then it's a local span
                 # which is represented by kind = None.
                 log.warning("The include argument is deprecated. Please use kind.")
-                if "client" in include and "server" not in include:
-                    return Kind.CLIENT
-                elif "client" not in include and "server" in include:
-                    return Kind.SERVER
-                else:
-                    return Kind.LOCAL
+                mask = 0
+                if "client" in include:
+                    mask |= _INCLUDE_CLIENT
+                if "server" in include:
+                    mask |= _INCLUDE_SERVER
+                return _KIND_BY_INCLUDE_MASK[mask]
 
         # If both kind and include are unset, then it's a local span.
         return Kind.LOCAL
@@ -376,6 +549,7 @@ class zipkin_span:
                         create_attrs_for_span(
                             sample_rate=self.sample_rate,
                             trace_id=self.zipkin_attrs_override.trace_id,
+                            sampler=self.sampler,
                         ),
                     )
 
@@ -387,6 +561,7 @@ class zipkin_span:
                         create_attrs_for_span(
                             sample_rate=self.sample_rate,
                             use_128bit_trace_id=self.use_128bit_trace_id,
+                            sampler=self.sampler,
                         ),
                     )
 
@@ -412,14 +587,16 @@ class zipkin_span:
             # If there's an existing context, let's create new zipkin_attrs
             # with that context as parent.
             if existing_zipkin_attrs:
+                # This runs for every child span, so pass the fields
+                # positionally to avoid building a kwargs dict.
                 return (
                     False,
                     ZipkinAttrs(
-                        trace_id=existing_zipkin_attrs.trace_id,
-                        span_id=generate_random_64bit_string(),
-                        parent_span_id=existing_zipkin_attrs.span_id,
-                        flags=existing_zipkin_attrs.flags,
-                        is_sampled=existing_zipkin_attrs.is_sampled,
+                        existing_zipkin_attrs.trace_id,
+                        generate_random_64bit_string(),
+                        existing_zipkin_attrs.span_id,
+                        existing_zipkin_attrs.flags,
+                        existing_zipkin_attrs.is_sampled,
                     ),
                 )
 
@@ -430,12 +607,29 @@ class zipkin_span:
         context will be attributed to this span. All new spans generated
         inside this context will have this span as their parent.
 
-        In the unsampled case, this context still generates new span IDs and
-        pushes them onto the threadlocal stack, so downstream services calls
-        made will pass the correct headers. However, the logging handler is
-        never attached in the unsampled case, so the spans are never logged.
+        In the unsampled case, nothing is ever logged. A local root span
+        still pushes its attrs onto the context stack so that downstream
+        service calls pass the unsampled decision along, but a child span of
+        an unsampled trace (that isn't recorded by a firehose handler either)
+        doesn't generate a new span id or push anything: its zipkin_attrs are
+        its parent's, span_id included. Headers created inside it with
+        create_http_headers() therefore carry the parent's ids, unless
+        new_span_id=True is passed.
         """
         self.do_pop_attrs = False
+        # Resolving the current tracer means a contextvars lookup, so only
+        # do it once.
+        tracer = self.get_tracer()
+
+        # Inside a trace that isn't sampled (and isn't recorded by a firehose
+        # handler either) nothing will ever be logged, so just reuse the
+        # parent's attrs rather than generating and pushing new ones. Headers
+        # for downstream calls are still generated from them.
+        if not self._is_local_root_span and not tracer.is_transport_configured():
+            existing_zipkin_attrs = tracer.get_zipkin_attrs()
+            if existing_zipkin_attrs and not existing_zipkin_attrs.is_sampled:
+                self.zipkin_attrs = existing_zipkin_attrs
+                return self
 
         report_root_timestamp, self.zipkin_attrs = self._get_current_context()
 
@@ -446,10 +640,23 @@ class zipkin_span:
         if not self.zipkin_attrs:
             return self
 
-        self.get_tracer().push_zipkin_attrs(self.zipkin_attrs)
+        tracer.push_zipkin_attrs(self.zipkin_attrs)
         self.do_pop_attrs = True
 
+        if (
+            self._is_local_root_span
+            and not self.zipkin_attrs.is_sampled
+            and not self.firehose_handler
+            and not tracer.is_transport_configured()
+        ):
+            # Nothing is going to be logged for this trace, so don't bother
+            # reading the clocks either.
+            return self
+
         self.start_timestamp = time.time()
+        # Durations are measured with perf_counter, which is monotonic and
+        # saves calling time.time() again when the span stops.
+        self._start_counter = time.perf_counter()
 
         if self._is_local_root_span:
             # Don't set up any logging if we're not sampling
@@ -458,13 +665,13 @@ class zipkin_span:
             # If transport is already configured don't override it. Doing so would
             # cause all previously recorded spans to never be emitted as exiting
             # the inner logging context will reset transport_configured to False.
-            if self.get_tracer().is_transport_configured():
+            if tracer.is_transport_configured():
                 log.info(
                     "Transport was already configured, ignoring override "
                     "from span {}".format(self.span_name)
                 )
                 return self
-            endpoint = create_endpoint(self.port, self.service_name, self.host)
+            endpoint = _create_endpoint_cached(self.port, self.service_name, self.host)
             self.logging_context = ZipkinLoggingContext(
                 self.zipkin_attrs,
                 endpoint,
@@ -473,16 +680,18 @@ class zipkin_span:
                 report_root_timestamp or self.report_root_timestamp_override,
                 self.get_tracer,
                 self.service_name,
-                binary_annotations=self.binary_annotations,
+                binary_annotations=self._binary_annotations,
                 add_logging_annotation=self.add_logging_annotation,
                 client_context=self.kind == Kind.CLIENT,
                 max_span_batch_size=self.max_span_batch_size,
+                max_span_batch_bytes=self.max_span_batch_bytes,
                 firehose_handler=self.firehose_handler,
                 encoding=self.encoding,
-                annotations=self.annotations,
+                annotations=self._annotations,
+                emit_in_background=self.emit_in_background,
             )
             self.logging_context.start()
-            self.get_tracer().set_transport_configured(configured=True)
+            tracer.set_transport_configured(configured=True)
 
         return self
 
@@ -500,19 +709,20 @@ class zipkin_span:
         _exc_value: Optional[BaseException] = None,
         _exc_traceback: Optional[TracebackType] = None,
     ) -> None:
-        """Exit the span context. Zipkin attrs are pushed onto the
-        threadlocal stack regardless of sampling, so they always need to be
-        popped off. The actual logging of spans depends on sampling and that
-        the logging was correctly set up.
+        """Exit the span context. Zipkin attrs are popped off the context
+        stack if start() pushed them, which it doesn't do for child spans of
+        unsampled traces. The actual logging of spans depends on sampling and
+        that the logging was correctly set up.
         """
 
+        tracer = self.get_tracer()
         if self.do_pop_attrs:
-            self.get_tracer().pop_zipkin_attrs()
+            tracer.pop_zipkin_attrs()
 
         # If no transport is configured, there's no reason to create a new Span.
         # This also helps avoiding memory leaks since without a transport nothing
         # would pull spans out of get_tracer().
-        if not self.get_tracer().is_transport_configured():
+        if not tracer.is_transport_configured():
             return
 
         # Add the error annotation if an exception occurred
@@ -537,23 +747,22 @@ class zipkin_span:
                 log.error(err_msg)
             finally:
                 self.logging_context = None
-                self.get_tracer().clear()
-                self.get_tracer().set_transport_configured(configured=False)
+                tracer.clear()
+                tracer.set_transport_configured(configured=False)
                 return
 
         # If we've gotten here, that means that this span is a child span of
         # this context's root span (i.e. it's a zipkin_span inside another
         # zipkin_span).
-        end_timestamp = time.time()
         # If self.duration is set, it means the user wants to override it
         if self.duration:
             duration = self.duration
         else:
-            duration = end_timestamp - self.start_timestamp
+            duration = time.perf_counter() - self._start_counter
 
-        endpoint = create_endpoint(self.port, self.service_name, self.host)
+        endpoint = _create_endpoint_cached(self.port, self.service_name, self.host)
         assert self.zipkin_attrs is not None
-        self.get_tracer().add_span(
+        tracer.add_span(
             Span(
                 trace_id=self.zipkin_attrs.trace_id,
                 name=self.span_name,
@@ -562,10 +771,10 @@ class zipkin_span:
                 kind=self.kind,
                 timestamp=self.timestamp if self.timestamp else self.start_timestamp,
                 duration=duration,
-                annotations=self.annotations,
+                annotations=self._annotations,
                 local_endpoint=endpoint,
                 remote_endpoint=self.remote_endpoint,
-                tags=self.binary_annotations,
+                tags=self._binary_annotations,
             )
         )
 
@@ -580,7 +789,7 @@ class zipkin_span:
         else:
             # Otherwise, we're in the context of the root span, so just update
             # the binary annotations for the logging context directly.
-            self.logging_context.tags.update(extra_annotations)
+            self.logging_context.update_tags(extra_annotations)
 
     def add_annotation(self, value: str, timestamp: Optional[float] = None) -> None:
         """Add an annotation for the current span
@@ -627,11 +836,7 @@ class zipkin_span:
             # should result in a logged error
             return
 
-        remote_endpoint = create_endpoint(
-            port=port,
-            service_name=service_name,
-            host=host,
-        )
+        remote_endpoint = _create_endpoint_cached(port, service_name, host)
         if not self.logging_context:
             if self.remote_endpoint is not None:
                 raise ValueError("SA annotation already set.")
@@ -671,6 +876,8 @@ class zipkin_client_span(zipkin_span):
     Subclass of :class:`zipkin_span` using only annotations relevant to clients
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Logs a zipkin span with client annotations.
 
@@ -688,6 +895,8 @@ class zipkin_server_span(zipkin_span):
     Subclass of :class:`zipkin_span` using only annotations relevant to servers
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Logs a zipkin span with server annotations.
 
@@ -714,3 +923,20 @@ def create_http_headers_for_new_span(
                 X-B3-Flags and X-B3-Sampled) keys OR an empty dict.
     """
     return create_http_headers(context_stack, tracer, True)
+
+
+def create_http_headers_for_new_span_items(
+    context_stack: Optional[Stack] = None, tracer: Optional[Tracer] = None
+) -> HeaderItems:
+    """
+    Generate the headers for a new zipkin span as (name, value) pairs.
+
+    .. note::
+
+        If the method is not called from within a zipkin_trace context,
+        empty tuple will be returned back.
+
+    :returns: tuple of (X-B3-TraceId, X-B3-SpanId, X-B3-ParentSpanId,
+                X-B3-Flags and X-B3-Sampled) header pairs OR an empty tuple.
+    """
+    return create_http_header_items(context_stack, tracer, True)
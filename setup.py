@@ -32,7 +32,7 @@ setup(
         'typing-extensions>=3.10.0.0',
     ],
     extras_require={
-        'protobuf': 'protobuf >= 3.12.4',
+        'protobuf': 'protobuf >= 4.21.0',
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,141 @@
+import os
+import queue
+import threading
+from unittest import mock
+
+import pytest
+
+from py_zipkin import emitter
+from py_zipkin import logging_helper
+
+
+def test_submit_sends_spans_in_background():
+    span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+    spans = [mock.Mock(), mock.Mock()]
+
+    emitter.submit(spans, span_sender)
+
+    assert emitter.flush(timeout=5) is True
+    span_sender.send.assert_called_once_with(spans)
+    assert emitter._worker is not None
+    assert emitter._worker.daemon is True
+
+
+def test_submit_restarts_dead_worker():
+    emitter.flush(timeout=5)
+    dead_worker = threading.Thread(target=lambda: None)
+    dead_worker.start()
+    dead_worker.join()
+
+    # Use a separate queue so that the new worker doesn't keep consuming
+    # the real one alongside the original worker once the patch is undone.
+    with mock.patch.object(emitter, "_worker", dead_worker), mock.patch.object(
+        emitter, "EMITTER_QUEUE", queue.SimpleQueue()
+    ):
+        span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+        emitter.submit([], span_sender)
+        assert emitter._worker is not dead_worker
+
+        assert emitter.flush(timeout=5) is True
+        assert span_sender.send.call_count == 1
+
+
+@mock.patch.object(emitter.log, "error", autospec=True)
+def test_worker_survives_transport_errors(mock_log):
+    failing_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+    failing_sender.send.side_effect = Exception("boom")
+    span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+
+    emitter.submit([], failing_sender)
+    emitter.submit([], span_sender)
+
+    assert emitter.flush(timeout=5) is True
+    assert mock_log.call_count == 1
+    assert span_sender.send.call_count == 1
+
+
+def test_flush_timeout():
+    release = threading.Event()
+    span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+    span_sender.send.side_effect = lambda spans: release.wait(5)
+
+    emitter.submit([], span_sender)
+
+    assert emitter.flush(timeout=0.01) is False
+    release.set()
+    assert emitter.flush(timeout=5) is True
+
+
+def test_flush_without_worker():
+    with mock.patch.object(emitter, "_worker", None), mock.patch.object(
+        emitter, "_ensure_worker", autospec=True
+    ) as mock_ensure_worker:
+        assert emitter.flush(timeout=0) is True
+
+    assert mock_ensure_worker.call_count == 0
+
+
+def test_reset_after_fork():
+    worker = mock.Mock()
+    lock = threading.Lock()
+    jobs = queue.SimpleQueue()
+    with mock.patch.object(emitter, "_worker", worker), mock.patch.object(
+        emitter, "_worker_lock", lock
+    ), mock.patch.object(emitter, "EMITTER_QUEUE", jobs):
+        emitter._reset_after_fork()
+
+        assert emitter._worker is None
+        assert emitter._worker_lock is not lock
+        assert emitter.EMITTER_QUEUE is not jobs
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_fork_does_not_resend_queued_spans():
+    release = threading.Event()
+    blocking_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+    blocking_sender.send.side_effect = lambda spans: release.wait(5)
+    span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+
+    # The second job is still queued behind the first one at fork time.
+    emitter.submit([], blocking_sender)
+    emitter.submit([], span_sender)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        release.set()
+        emitter.submit([], mock.Mock(spec=logging_helper.ZipkinBatchSender))
+        emitter.flush(timeout=5)
+        os._exit(span_sender.send.call_count)
+
+    _, status = os.waitpid(pid, 0)
+    release.set()
+    assert emitter.flush(timeout=5) is True
+    assert os.WEXITSTATUS(status) == 0
+    assert span_sender.send.call_count == 1
+
+
+@mock.patch.object(emitter.log, "warning", autospec=True)
+def test_submit_drops_spans_when_queue_is_full(mock_log):
+    jobs = queue.SimpleQueue()
+    span_sender = mock.Mock(spec=logging_helper.ZipkinBatchSender)
+    with mock.patch.object(emitter, "EMITTER_QUEUE", jobs), mock.patch.object(
+        emitter, "MAX_QUEUED_TRACES", 2
+    ), mock.patch.object(emitter, "_ensure_worker", autospec=True):
+        emitter.submit([mock.Mock()], span_sender)
+        emitter.submit([mock.Mock()], span_sender)
+        emitter.submit([mock.Mock()], span_sender)
+
+    assert jobs.qsize() == 2
+    assert mock_log.call_count == 1
+
+
+@pytest.mark.parametrize("flushed,warnings", [(True, 0), (False, 1)])
+@mock.patch.object(emitter.log, "warning", autospec=True)
+@mock.patch.object(emitter, "flush", autospec=True)
+def test_flush_at_exit(mock_flush, mock_log, flushed, warnings):
+    mock_flush.return_value = flushed
+
+    emitter._flush_at_exit()
+
+    assert mock_flush.call_args == mock.call(timeout=emitter.EXIT_FLUSH_TIMEOUT)
+    assert mock_log.call_count == warnings
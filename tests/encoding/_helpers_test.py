@@ -111,6 +111,12 @@ def test_malformed_host():
     assert endpoint.ipv6 is None
 
 
+def test_malformed_ipv6_host():
+    endpoint = create_endpoint(port=8080, service_name="foo", host="2001::db8::1")
+    assert endpoint.ipv4 is None
+    assert endpoint.ipv6 is None
+
+
 class TestSpan:
     @pytest.mark.parametrize(
         ["kind", "annotations"],
@@ -136,3 +142,16 @@ class TestSpan:
         v1_span = span.build_v1_span()
 
         assert v1_span.annotations == annotations
+
+    def test_span_has_no_instance_dict(self):
+        span = Span(
+            trace_id=generate_random_64bit_string(),
+            name="test span",
+            parent_id=None,
+            span_id=generate_random_64bit_string(),
+            kind=Kind.LOCAL,
+            timestamp=26.0,
+            duration=4.0,
+        )
+        assert not hasattr(span, "__dict__")
+        assert span._asdict()["name"] == "test span"
@@ -89,6 +89,17 @@ def test_convert_endpoint():
     )
 
 
+def test_convert_endpoint_is_memoized():
+    endpoint = create_endpoint(8888, "service1", "127.0.0.1")
+    pb_endpoint = protobuf._convert_endpoint(endpoint)
+    assert protobuf._convert_endpoint(endpoint) is pb_endpoint
+
+    # Spans get their own copy, so the memoized message can't be modified
+    pb_span = zipkin_pb2.Span(local_endpoint=pb_endpoint)
+    pb_span.local_endpoint.port = 42
+    assert pb_endpoint.port == 8888
+
+
 def test_convert_annotations():
     annotations = protobuf._convert_annotations({"foo": 123.456, "bar": 456.789})
     # The annotations dict is unordered in python < 3.6 so we need to sort the
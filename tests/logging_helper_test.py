@@ -499,3 +499,159 @@ def test_batch_sender_defensive_about_transport_handler(fake_endpoint):
         )
     assert encoder.encode_span.call_count == 1
     assert encoder.encode_queue.call_count == 0
+
+
+@mock.patch("py_zipkin.logging_helper.emitter.submit", autospec=True)
+@mock.patch("py_zipkin.logging_helper.ZipkinBatchSender.add_span", autospec=True)
+def test_zipkin_logging_context_emit_spans_in_background(
+    add_span_mock, submit_mock, fake_endpoint
+):
+    attr = ZipkinAttrs(
+        trace_id="0000000000000001",
+        span_id="0000000000000002",
+        parent_span_id=None,
+        flags=None,
+        is_sampled=True,
+    )
+    tracer = MockTracer()
+    transport_handler = mock.Mock()
+
+    context = logging_helper.ZipkinLoggingContext(
+        zipkin_attrs=attr,
+        endpoint=fake_endpoint,
+        span_name="span_name",
+        transport_handler=transport_handler,
+        report_root_timestamp=False,
+        get_tracer=lambda: tracer,
+        service_name="test_server",
+        encoding=Encoding.V2_JSON,
+        emit_in_background=True,
+    )
+    context.start()
+    context.emit_spans()
+
+    # Spans are handed over to the emitter rather than being encoded here.
+    assert add_span_mock.call_count == 0
+    assert submit_mock.call_count == 1
+    spans, span_sender = submit_mock.call_args[0]
+    assert [span.span_id for span in spans] == ["0000000000000002"]
+    assert span_sender.transport_handler == transport_handler
+    assert len(tracer.get_spans()) == 0
+
+
+def test_zipkin_logging_context_collect_spans_shares_endpoints(fake_endpoint):
+    attr = ZipkinAttrs(
+        trace_id="0000000000000001",
+        span_id="0000000000000002",
+        parent_span_id=None,
+        flags=None,
+        is_sampled=True,
+    )
+    tracer = MockTracer()
+    for span_id, service_name in (("3", "svc_a"), ("4", "svc_b"), ("5", "svc_a")):
+        tracer.add_span(
+            Span(
+                trace_id="0000000000000001",
+                name="child",
+                parent_id="0000000000000002",
+                span_id=span_id,
+                kind=Kind.LOCAL,
+                timestamp=26.0,
+                duration=4.0,
+                local_endpoint=create_endpoint(service_name=service_name),
+            )
+        )
+    context = logging_helper.ZipkinLoggingContext(
+        zipkin_attrs=attr,
+        endpoint=fake_endpoint,
+        span_name="span_name",
+        transport_handler=MockTransportHandler(),
+        report_root_timestamp=False,
+        get_tracer=lambda: tracer,
+        service_name="test_server",
+        encoding=Encoding.V2_JSON,
+    )
+    context.start()
+
+    span_a1, span_b, span_a2, _ = context._collect_spans()
+
+    assert span_a1.local_endpoint == fake_endpoint._replace(service_name="svc_a")
+    assert span_b.local_endpoint == fake_endpoint._replace(service_name="svc_b")
+    assert span_a2.local_endpoint is span_a1.local_endpoint
+
+
+@pytest.mark.parametrize(
+    "max_payload_bytes, transport_max_bytes, expected",
+    [
+        (None, None, None),
+        (500, None, 500),
+        (None, 1000, 1000),
+        (500, 1000, 500),
+        (1000, 500, 500),
+    ],
+)
+def test_batch_sender_max_payload_bytes(
+    max_payload_bytes, transport_max_bytes, expected
+):
+    sender = logging_helper.ZipkinBatchSender(
+        MockTransportHandler(transport_max_bytes),
+        None,
+        get_encoder(Encoding.V2_JSON),
+        max_payload_bytes,
+    )
+    assert sender.max_payload_bytes == expected
+
+
+def test_batch_sender_max_payload_bytes_with_function_transport(fake_endpoint):
+    # Plain functions can't declare their max payload size, so the limit
+    # passed in by the caller is the only one we can enforce.
+    transport_handler = mock.Mock()
+    sender = logging_helper.ZipkinBatchSender(
+        transport_handler,
+        None,
+        get_encoder(Encoding.V2_JSON),
+        1000,
+    )
+    sender.send(
+        [
+            Span(
+                trace_id="000000000000000f",
+                name="span",
+                parent_id="0000000000000001",
+                span_id="0000000000000002",
+                kind=Kind.CLIENT,
+                timestamp=26.0,
+                duration=4.0,
+                local_endpoint=fake_endpoint,
+            )
+            for _ in range(10)
+        ]
+    )
+
+    # Each encoded span is 249 bytes, so only 3 of them fit in a batch.
+    assert transport_handler.call_count == 4
+    for call in transport_handler.call_args_list:
+        assert len(call[0][0]) <= 1000
+
+
+def test_zipkin_logging_context_update_tags(fake_endpoint):
+    context = logging_helper.ZipkinLoggingContext(
+        zipkin_attrs=ZipkinAttrs(None, None, None, None, False),
+        endpoint=fake_endpoint,
+        span_name="span_name",
+        transport_handler=MockTransportHandler(),
+        report_root_timestamp=False,
+        get_tracer=MockTracer,
+        service_name="test_server",
+        binary_annotations={"k": "v"},
+        encoding=Encoding.V2_JSON,
+    )
+    context.update_tags({"k2": "v2"})
+    context.update_tags({"k": "v3"})
+    # Tags are only queued until someone reads them
+    assert context._tags == {"k": "v"}
+    assert context.tags == {"k": "v3", "k2": "v2"}
+
+    context.update_tags({"k4": "v4"})
+    context.tags = {"new": "tags"}
+    assert context.tags == {"new": "tags"}
@@ -4,6 +4,7 @@ import pytest
 
 from py_zipkin import request_helpers
 from py_zipkin.request_helpers import ZipkinAttrs
+from py_zipkin.sampler import BaseSampler
 from tests.test_helpers import MockTracer
 
 
@@ -166,7 +167,7 @@ def test_extract_zipkin_attrs_from_headers_invalids():
 
 
 @pytest.mark.parametrize("no_trace_str,yes_trace_str", [("0", "1"), ("false", "true")])
-@mock.patch("py_zipkin.util.random.random")
+@mock.patch("py_zipkin.util.random.Random.random")
 def test_extract_zipkin_attrs_from_headers_multi(
     mock_random, no_trace_str, yes_trace_str
 ):
@@ -359,7 +360,7 @@ def test_extract_zipkin_attrs_from_headers_multi(
 
 
 @pytest.mark.parametrize("yes_trace_str", ("1", "d"))
-@mock.patch("py_zipkin.util.random.random")
+@mock.patch("py_zipkin.util.random.Random.random")
 def test_extract_zipkin_attrs_from_headers_single(mock_random, yes_trace_str):
     # b3={TraceId}-{SpanId}-{SamplingState}-{ParentSpanId}
     # where the last two fields are optional.
@@ -467,6 +468,34 @@ def test_extract_zipkin_attrs_from_headers_single(mock_random, yes_trace_str):
     )
 
 
+def test_extract_zipkin_attrs_from_headers_deferred_uses_sampler():
+    mock_sampler = mock.Mock(spec=BaseSampler)
+    mock_sampler.should_sample.return_value = True
+
+    attrs = request_helpers.extract_zipkin_attrs_from_headers(
+        {"X-B3-TraceId": "bd7a977555f6b982", "X-B3-SpanId": "be2d01e33cc78d97"},
+        sample_rate=12.5,
+        sampler=mock_sampler,
+    )
+
+    assert attrs.is_sampled is True
+    assert mock_sampler.should_sample.call_args == mock.call("bd7a977555f6b982", 12.5)
+
+    # The sampler isn't asked when the headers carry a decision
+    mock_sampler.should_sample.reset_mock()
+    attrs = request_helpers.extract_zipkin_attrs_from_headers(
+        {
+            "X-B3-TraceId": "bd7a977555f6b982",
+            "X-B3-SpanId": "be2d01e33cc78d97",
+            "X-B3-Sampled": "0",
+        },
+        sampler=mock_sampler,
+    )
+
+    assert attrs.is_sampled is False
+    assert mock_sampler.should_sample.call_count == 0
+
+
 def test_create_http_headers_context_stack():
     mock_context_stack = mock.Mock()
     mock_context_stack.get.return_value = ZipkinAttrs(
@@ -540,3 +569,37 @@ def test_create_http_headers_new_span_id(gen_mock):
         "X-B3-Flags": "0",
         "X-B3-Sampled": "1",
     }
+
+
+def test_create_http_header_items_no_active_request():
+    assert request_helpers.create_http_header_items(tracer=MockTracer()) == ()
+
+
+@mock.patch("py_zipkin.request_helpers.generate_random_64bit_string", autospec=True)
+def test_create_http_header_items(gen_mock):
+    tracer = MockTracer()
+    tracer.push_zipkin_attrs(
+        ZipkinAttrs(
+            trace_id="17133d482ba4f605",
+            span_id="37133d482ba4f605",
+            is_sampled=False,
+            parent_span_id="27133d482ba4f605",
+            flags=None,
+        )
+    )
+    gen_mock.return_value = "47133d482ba4f605"
+
+    assert request_helpers.create_http_header_items(
+        tracer=tracer, new_span_id=True
+    ) == (
+        ("X-B3-TraceId", "17133d482ba4f605"),
+        ("X-B3-SpanId", "47133d482ba4f605"),
+        ("X-B3-ParentSpanId", "37133d482ba4f605"),
+        ("X-B3-Flags", "0"),
+        ("X-B3-Sampled", "0"),
+    )
+
+    # The pairs match what's returned by create_http_headers
+    assert dict(request_helpers.create_http_header_items(tracer=tracer)) == (
+        request_helpers.create_http_headers(tracer=tracer)
+    )
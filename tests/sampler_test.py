@@ -0,0 +1,52 @@
+from unittest import mock
+
+import pytest
+
+from py_zipkin import sampler
+
+
+@mock.patch("py_zipkin.sampler._should_sample", autospec=True)
+def test_random_sampler(mock_should_sample):
+    mock_should_sample.return_value = True
+
+    assert sampler.RandomSampler().should_sample("0000000000000042", 5.0) is True
+    assert mock_should_sample.call_args == mock.call(5.0)
+
+
+@pytest.mark.parametrize(
+    "trace_id,sample_rate,expected",
+    [
+        ("ffffffffffffffff", 0.0, False),
+        ("0000000000000000", 0.0, False),
+        ("ffffffffffffffff", 100.0, True),
+        ("0000000000000000", 1.0, True),
+        ("028f5c28f5c28f00", 1.0, True),  # Just below 1% of 2**64
+        ("028f5c28f5c29000", 1.0, False),  # Just above 1% of 2**64
+        ("7fffffffffffffff", 50.0, True),
+        ("8000000000000000", 50.0, False),
+        # Only the lowest 64 bits of 128-bit trace ids are used
+        ("ffffffffffffffff7fffffffffffffff", 50.0, True),
+        ("000000000000000080000000000000ff", 50.0, False),
+    ],
+)
+def test_trace_id_sampler(trace_id, sample_rate, expected):
+    assert sampler.TraceIdSampler().should_sample(trace_id, sample_rate) is expected
+
+
+@mock.patch("py_zipkin.sampler._should_sample", autospec=True)
+def test_trace_id_sampler_invalid_trace_id(mock_should_sample):
+    mock_should_sample.return_value = False
+
+    assert sampler.TraceIdSampler().should_sample("not-a-hex-id", 50.0) is False
+    assert mock_should_sample.call_args == mock.call(50.0)
+
+
+def test_trace_id_sampler_rate():
+    trace_id_sampler = sampler.TraceIdSampler()
+    trace_ids = [f"{i << 52:016x}" for i in range(4096)]
+
+    sampled = [t for t in trace_ids if trace_id_sampler.should_sample(t, 25.0)]
+
+    assert len(sampled) == 1024
+    # Services with a higher sample rate sample a superset of the traces
+    assert all(trace_id_sampler.should_sample(t, 30.0) for t in sampled)
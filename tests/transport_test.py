@@ -1,4 +1,6 @@
+import threading
 from unittest import mock
+from urllib.error import HTTPError
 
 import pytest
 
@@ -39,8 +41,9 @@ class TestSimpleHTTPTransport:
             generate_list_of_spans(encoding)[0]
         ) == (path, content_type)
 
-    @mock.patch("py_zipkin.transport.urlopen", autospec=True)
-    def test_send(self, mock_urlopen):
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send(self, mock_connection_cls):
+        mock_connection_cls.return_value.getresponse.return_value.status = 202
         transport = SimpleHTTPTransport("localhost", 9411)
         with zipkin_span(
             service_name="my_service",
@@ -51,9 +54,88 @@ class TestSimpleHTTPTransport:
         ):
             pass
 
-        assert mock_urlopen.call_count == 1
-        request = mock_urlopen.call_args[0][0]
-        assert request.get_full_url() == "http://localhost:9411/api/v2/spans"
-        # I don't understand why, but Type gets lowercased to type by urllib
-        # Header keys are case insensitive anyway, so it's not a big deal
-        assert request.get_header("Content-type") == "application/json"
+        assert mock_connection_cls.call_args == mock.call(
+            "localhost", 9411, timeout=10.0
+        )
+        connection = mock_connection_cls.return_value
+        assert connection.request.call_count == 1
+        method, path, _, headers = connection.request.call_args[0]
+        assert method == "POST"
+        assert path == "/api/v2/spans"
+        assert headers == {"Content-Type": "application/json"}
+        assert connection.getresponse.return_value.read.call_count == 1
+
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_reuses_connection(self, mock_connection_cls):
+        mock_connection_cls.return_value.getresponse.return_value.status = 202
+        transport = SimpleHTTPTransport("localhost", 9411)
+
+        transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+        transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+
+        assert mock_connection_cls.call_count == 1
+        assert mock_connection_cls.return_value.request.call_count == 2
+
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_reconnects_when_closed(self, mock_connection_cls):
+        stale_connection = mock.Mock()
+        stale_connection.request.side_effect = ConnectionResetError
+        new_connection = mock.Mock()
+        new_connection.getresponse.return_value.status = 202
+        mock_connection_cls.side_effect = [stale_connection, new_connection]
+        transport = SimpleHTTPTransport("localhost", 9411)
+
+        transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+
+        assert stale_connection.close.call_count == 1
+        assert new_connection.request.call_count == 1
+        assert transport._local.connection is new_connection
+
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_raises_after_retry(self, mock_connection_cls):
+        mock_connection_cls.return_value.request.side_effect = ConnectionRefusedError
+        transport = SimpleHTTPTransport("localhost", 9411)
+
+        with pytest.raises(ConnectionRefusedError):
+            transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+
+        assert mock_connection_cls.call_count == 2
+        assert transport._local.connection is None
+
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_uses_one_connection_per_thread(self, mock_connection_cls):
+        mock_connection_cls.return_value.getresponse.return_value.status = 202
+        transport = SimpleHTTPTransport("localhost", 9411, timeout=1.5)
+        payload = generate_list_of_spans(Encoding.V2_JSON)[0]
+
+        thread = threading.Thread(target=transport.send, args=(payload,))
+        thread.start()
+        thread.join()
+        transport.send(payload)
+
+        assert mock_connection_cls.call_count == 2
+        assert mock_connection_cls.call_args == mock.call(
+            "localhost", 9411, timeout=1.5
+        )
+
+    @pytest.mark.parametrize("status", [200, 202])
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_accepts_success_status(self, mock_connection_cls, status):
+        mock_connection_cls.return_value.getresponse.return_value.status = status
+        transport = SimpleHTTPTransport("localhost", 9411)
+
+        transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+
+    @pytest.mark.parametrize("status", [302, 400, 500])
+    @mock.patch("py_zipkin.transport.HTTPConnection", autospec=True)
+    def test_send_raises_on_error_status(self, mock_connection_cls, status):
+        response = mock_connection_cls.return_value.getresponse.return_value
+        response.status = status
+        response.reason = "Nope"
+        transport = SimpleHTTPTransport("localhost", 9411)
+
+        with pytest.raises(HTTPError) as excinfo:
+            transport.send(generate_list_of_spans(Encoding.V2_JSON)[0])
+
+        assert excinfo.value.code == status
+        assert excinfo.value.url == "http://localhost:9411/api/v2/spans"
@@ -1,22 +1,33 @@
+import threading
 from unittest import mock
 
+import pytest
+
 from py_zipkin import util
 from py_zipkin.util import ZipkinAttrs
 
 
-@mock.patch("py_zipkin.util.random.getrandbits", autospec=True)
-def test_generate_random_64bit_string(rand):
-    rand.return_value = 0x17133D482BA4F605
+@mock.patch("py_zipkin.util._ID_POOL_SIZE", 2)
+@mock.patch("py_zipkin.util._thread_local", threading.local())
+@mock.patch("py_zipkin.util._get_random", autospec=True)
+def test_generate_random_64bit_string(mock_get_random):
+    rand = mock_get_random.return_value.getrandbits
+    rand.return_value = 0x17133D482BA4F6050000000000000042
     random_string = util.generate_random_64bit_string()
-    assert random_string == "17133d482ba4f605"
+    assert random_string == "0000000000000042"
+    rand.assert_called_once_with(128)
+    # The second id comes from the same batch
+    assert util.generate_random_64bit_string() == "17133d482ba4f605"
+    assert rand.call_count == 1
     # This acts as a contract test of sorts. This should return a str
     # in both py2 and py3. IOW, no unicode objects.
     assert isinstance(random_string, str)
 
 
 @mock.patch("py_zipkin.util.time.time", autospec=True)
-@mock.patch("py_zipkin.util.random.getrandbits", autospec=True)
-def test_generate_random_128bit_string(rand, mock_time):
+@mock.patch("py_zipkin.util._get_random", autospec=True)
+def test_generate_random_128bit_string(mock_get_random, mock_time):
+    rand = mock_get_random.return_value.getrandbits
     rand.return_value = 0x2BA4F60517133D482BA4F605
     mock_time.return_value = float(0x17133D48)
     random_string = util.generate_random_128bit_string()
@@ -27,6 +38,43 @@ def test_generate_random_128bit_string(rand, mock_time):
     assert isinstance(random_string, str)
 
 
+def test_get_random_is_per_thread():
+    rand = util._get_random()
+    assert util._get_random() is rand
+
+    other_thread_rand = []
+    thread = threading.Thread(
+        target=lambda: other_thread_rand.append(util._get_random())
+    )
+    thread.start()
+    thread.join()
+
+    assert other_thread_rand[0] is not rand
+
+
+def test_zipkin_attrs_is_an_immutable_tuple():
+    attrs = ZipkinAttrs("0000000000000001", "0000000000000002", None, "0", True)
+
+    assert isinstance(attrs, tuple)
+    # Instances are hashable, so they have to stay immutable.
+    with pytest.raises(AttributeError):
+        attrs.is_sampled = False
+
+
+def test_generate_random_64bit_string_unique():
+    ids = {util.generate_random_64bit_string() for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(len(id) == 16 for id in ids)
+
+
+def test_reset_random():
+    rand = util._get_random()
+    id_pool = util._get_id_pool()
+    util._reset_random()
+    assert util._get_random() is not rand
+    assert util._get_id_pool() is not id_pool
+
+
 def test_unsigned_hex_to_signed_int():
     assert util.unsigned_hex_to_signed_int("17133d482ba4f605") == 1662740067609015813
     assert util.unsigned_hex_to_signed_int("b6dbb1c2b362bf51") == -5270423489115668655
@@ -79,3 +127,17 @@ def test_create_attrs_for_span(random_64bit_mock, random_128bit_mock):
         is_sampled=True,
     )
     assert expected_attrs == util.create_attrs_for_span(use_128bit_trace_id=True)
+
+
+def test_create_attrs_for_span_with_sampler():
+    sampler = mock.Mock()
+    sampler.should_sample.return_value = False
+
+    attrs = util.create_attrs_for_span(
+        sample_rate=100.0,
+        trace_id="0000000000000045",
+        sampler=sampler,
+    )
+
+    assert attrs.is_sampled is False
+    assert sampler.should_sample.call_args == mock.call("0000000000000045", 100.0)
@@ -10,6 +10,7 @@ from py_zipkin import Kind
 from py_zipkin.encoding._helpers import create_endpoint
 from py_zipkin.encoding._helpers import Span
 from py_zipkin.exception import ZipkinError
+from py_zipkin.sampler import TraceIdSampler
 from py_zipkin.storage import default_span_storage
 from py_zipkin.storage import get_default_tracer
 from py_zipkin.storage import SpanStorage
@@ -46,6 +47,7 @@ class TestZipkinSpan:
         stack = Stack([])
         span_storage = SpanStorage()
         tracer = MockTracer()
+        sampler = TraceIdSampler()
 
         context = tracer.zipkin_span(
             service_name="test_service",
@@ -69,6 +71,9 @@ class TestZipkinSpan:
             timestamp=1234,
             duration=10,
             encoding=Encoding.V2_JSON,
+            emit_in_background=True,
+            max_span_batch_bytes=1000,
+            sampler=sampler,
         )
 
         assert context.service_name == "test_service"
@@ -76,6 +81,7 @@ class TestZipkinSpan:
         assert context.zipkin_attrs_override == zipkin_attrs
         assert context.transport_handler == transport
         assert context.max_span_batch_size == 10
+        assert context.max_span_batch_bytes == 1000
         assert context.annotations == {"test_annotation": 1}
         assert context.binary_annotations == {"status": "200"}
         assert context.port == 80
@@ -96,6 +102,8 @@ class TestZipkinSpan:
         assert context.timestamp == 1234
         assert context.duration == 10
         assert context.encoding == Encoding.V2_JSON
+        assert context.emit_in_background is True
+        assert context.sampler == sampler
         assert context._tracer == tracer
         # Check for backward compatibility
         assert tracer.get_spans() == span_storage
@@ -113,10 +121,23 @@ class TestZipkinSpan:
 
         assert context.service_name == "test_service"
         assert context.span_name == "test_span"
+        # The dicts are only created when they're accessed
+        assert context._annotations is None
+        assert context._binary_annotations is None
         assert context.annotations == {}
         assert context.binary_annotations == {}
+        assert context.annotations is context._annotations
+        assert context.binary_annotations is context._binary_annotations
         assert mock_generate_kind.call_args == mock.call(context, None, None)
 
+    def test_set_annotations(self):
+        context = zipkin.zipkin_span("test_service", "test_span")
+        context.annotations = {"foo": 1}
+        context.binary_annotations = {"bar": "baz"}
+
+        assert context.annotations == {"foo": 1}
+        assert context.binary_annotations == {"bar": "baz"}
+
     @mock.patch.object(zipkin.log, "warning", autospec=True)
     def test_init_override_timestamp_by_sr_ss(self, mock_log):
         context = zipkin.zipkin_span(
@@ -246,10 +267,103 @@ class TestZipkinSpan:
             # We skip the first element of the signature since that's self.
             assert list(mock_ctx.call_args[1].keys()).sort() == signature[1:].sort()
 
+    def test_decorator_skips_init(self):
+        decorator = zipkin.zipkin_span(
+            "test_service",
+            "test_span",
+            transport_handler=MockTransportHandler(),
+            sample_rate=100.0,
+            binary_annotations={"a": "b"},
+        )
+
+        @decorator
+        def fn():
+            pass
+
+        with mock.patch.object(
+            zipkin.zipkin_span, "__init__", autospec=True
+        ) as mock_init, mock.patch.object(
+            zipkin.zipkin_span, "start", autospec=True
+        ) as mock_start, mock.patch.object(
+            zipkin.zipkin_span, "stop", autospec=True
+        ):
+            fn()
+
+        assert mock_init.call_count == 0
+        assert mock_start.call_count == 1
+        span = mock_start.call_args[0][0]
+        assert span is not decorator
+        # The copy is exactly what the constructor would have built
+        expected = zipkin.zipkin_span(
+            "test_service",
+            "test_span",
+            transport_handler=decorator.transport_handler,
+            sample_rate=100.0,
+            binary_annotations={"a": "b"},
+        )
+        for attr in zipkin.zipkin_span.__slots__:
+            if attr in ("__weakref__", "start_timestamp", "_start_counter"):
+                continue
+            assert getattr(span, attr) == getattr(expected, attr), attr
+
+    def test_decorator_subclass_builds_new_zipkin_span(self):
+        class MySpan(zipkin.zipkin_span):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.extra = "extra"
+
+        @MySpan(
+            "test_service",
+            "test_span",
+            transport_handler=MockTransportHandler(),
+            sample_rate=100.0,
+        )
+        def fn():
+            return 42
+
+        with mock.patch.object(
+            zipkin.zipkin_span, "start", autospec=True
+        ) as mock_start, mock.patch.object(zipkin.zipkin_span, "stop", autospec=True):
+            assert fn() == 42
+
+        # Subclasses don't get copied without going through __init__: like
+        # before the fast path existed, each call builds a new zipkin_span.
+        span = mock_start.call_args[0][0]
+        assert type(span) is zipkin.zipkin_span
+        assert span.service_name == "test_service"
+
+    def test_decorator_exception(self):
+        @zipkin.zipkin_span("test_service", "test_span")
+        def fn():
+            raise ValueError("boom")
+
+        with mock.patch.object(
+            zipkin.zipkin_span, "stop", autospec=True
+        ) as mock_stop, pytest.raises(ValueError):
+            fn()
+
+        assert mock_stop.call_count == 1
+        _, exc_type, exc_value, _ = mock_stop.call_args[0]
+        assert exc_type is ValueError
+        assert str(exc_value) == "boom"
+
+    def test_decorator_fast_path_missing_transport(self):
+        decorator = zipkin.zipkin_span("test_service", "test_span")
+        decorator.zipkin_attrs = ZipkinAttrs("0", "1", None, "0", True)
+
+        @decorator
+        def fn():
+            pass
+
+        with pytest.raises(ZipkinError):
+            fn()
+
     def test_enter(self):
         # Test that __enter__ calls self.start
         context = zipkin.zipkin_span("test_service", "test_span")
-        with mock.patch.object(context, "start", autospec=True) as mock_start:
+        with mock.patch.object(
+            zipkin.zipkin_span, "start", autospec=True
+        ) as mock_start:
             context.__enter__()
             assert mock_start.call_count == 1
 
@@ -260,6 +374,7 @@ class TestZipkinSpan:
         assert context._generate_kind(None, ("client",)) == Kind.CLIENT
         assert context._generate_kind(None, ("server",)) == Kind.SERVER
         assert context._generate_kind(None, ("client", "server")) == Kind.LOCAL
+        assert context._generate_kind(None, ("cs", "cr")) == Kind.LOCAL
         assert context._generate_kind(None, None) == Kind.LOCAL
 
     @mock.patch.object(zipkin, "create_attrs_for_span", autospec=True)
@@ -288,6 +403,7 @@ class TestZipkinSpan:
         assert mock_create_attr.call_args == mock.call(
             sample_rate=100.0,
             trace_id=zipkin_attrs.trace_id,
+            sampler=None,
         )
         # It wasn't sampled before and now it is, so this is the trace root
         assert report_root is True
@@ -341,6 +457,7 @@ class TestZipkinSpan:
         assert mock_create_attr.call_args == mock.call(
             sample_rate=100.0,
             use_128bit_trace_id=False,
+            sampler=None,
         )
         # No override, which means this is for sure the trace root
         assert report_root is True
@@ -425,6 +542,37 @@ class TestZipkinSpan:
             context.start()
             assert mock_push.call_count == 0
 
+    def test_start_non_root_not_sampled(self):
+        # Nothing is going to be logged, so the parent's attrs are reused
+        tracer = MockTracer()
+        parent_attrs = zipkin.create_attrs_for_span(sample_rate=0.0)
+        tracer.get_context().push(parent_attrs)
+        context = tracer.zipkin_span("test_service", "test_span")
+
+        with mock.patch.object(tracer, "push_zipkin_attrs") as mock_push:
+            context.start()
+            context.stop()
+
+        assert mock_push.call_count == 0
+        assert context.zipkin_attrs is parent_attrs
+        assert context.do_pop_attrs is False
+        assert tracer.get_zipkin_attrs() is parent_attrs
+
+    def test_start_non_root_not_sampled_transport_configured(self):
+        # A firehose handler is recording this trace, so a new span is created
+        tracer = MockTracer()
+        tracer.set_transport_configured(configured=True)
+        parent_attrs = zipkin.create_attrs_for_span(sample_rate=0.0)
+        tracer.get_context().push(parent_attrs)
+        context = tracer.zipkin_span("test_service", "test_span")
+
+        context.start()
+
+        assert context.zipkin_attrs.parent_span_id == parent_attrs.span_id
+        assert tracer.get_zipkin_attrs() == context.zipkin_attrs
+        context.stop()
+        assert len(tracer.get_spans()) == 1
+
     @mock.patch.object(zipkin, "ZipkinLoggingContext", autospec=True)
     @mock.patch("time.time", autospec=True, return_value=123)
     def test_start_root_span(self, mock_time, mock_log_ctx):
@@ -439,6 +587,7 @@ class TestZipkinSpan:
             firehose_handler=firehose,
             sample_rate=100.0,
             max_span_batch_size=50,
+            max_span_batch_bytes=1000,
             encoding=Encoding.V2_JSON,
         )
 
@@ -454,13 +603,15 @@ class TestZipkinSpan:
             True,
             context.get_tracer,
             "test_service",
-            binary_annotations={},
+            binary_annotations=None,
             add_logging_annotation=False,
             client_context=False,
             max_span_batch_size=50,
+            max_span_batch_bytes=1000,
             firehose_handler=firehose,
             encoding=Encoding.V2_JSON,
-            annotations={},
+            annotations=None,
+            emit_in_background=False,
         )
         assert mock_log_ctx.return_value.start.call_count == 1
         assert tracer.is_transport_configured() is True
@@ -476,12 +627,37 @@ class TestZipkinSpan:
             sample_rate=0.0,
         )
 
-        context.start()
+        with mock.patch("time.time", autospec=True) as mock_time:
+            context.start()
 
         assert context.zipkin_attrs is not None
+        assert context.do_pop_attrs is True
+        assert mock_time.call_count == 0
         assert mock_log_ctx.call_count == 0
         assert tracer.is_transport_configured() is False
 
+        context.stop()
+        assert tracer.get_zipkin_attrs() is None
+
+    @mock.patch.object(zipkin, "ZipkinLoggingContext", autospec=True)
+    def test_start_root_span_not_sampled_transport_configured(self, mock_log_ctx):
+        # An outer span already configured the transport, so this one is going
+        # to be logged as one of its spans when it stops.
+        tracer = MockTracer()
+        tracer.set_transport_configured(configured=True)
+        context = tracer.zipkin_span(
+            service_name="test_service",
+            span_name="test_span",
+            transport_handler=MockTransportHandler(),
+            sample_rate=0.0,
+        )
+
+        context.start()
+        context.stop()
+
+        assert mock_log_ctx.call_count == 0
+        assert len(tracer.get_spans()) == 1
+
     @mock.patch.object(zipkin, "ZipkinLoggingContext", autospec=True)
     def test_start_root_span_not_sampled_firehose(self, mock_log_ctx):
         # This request is not sampled, but firehose is setup. So we need to
@@ -530,9 +706,9 @@ class TestZipkinSpan:
     def test_exit(self):
         context = zipkin.zipkin_span("test_service", "test_span")
 
-        with mock.patch.object(context, "stop", autospec=True) as mock_stop:
+        with mock.patch.object(zipkin.zipkin_span, "stop", autospec=True) as mock_stop:
             context.__exit__(ValueError, "error", None)
-            assert mock_stop.call_args == mock.call(ValueError, "error", None)
+            assert mock_stop.call_args == mock.call(context, ValueError, "error", None)
 
     def test_stop_no_transport(self):
         # Transport is not setup, exit immediately
@@ -561,11 +737,13 @@ class TestZipkinSpan:
             span_storage=span_storage,
         )
 
-        with mock.patch.object(context, "update_binary_annotations") as mock_upd:
+        with mock.patch.object(
+            zipkin.zipkin_span, "update_binary_annotations", autospec=True
+        ) as mock_upd:
             context.start()
             context.stop(ValueError, "bad error")
             assert mock_upd.call_args == mock.call(
-                {zipkin.ERROR_KEY: "ValueError: bad error"}
+                context, {zipkin.ERROR_KEY: "ValueError: bad error"}
             )
             assert len(span_storage) == 0
 
@@ -588,16 +766,19 @@ class TestZipkinSpan:
             span_storage=span_storage,
         )
 
-        with mock.patch.object(context, "update_binary_annotations") as mock_upd:
+        with mock.patch.object(
+            zipkin.zipkin_span, "update_binary_annotations", autospec=True
+        ) as mock_upd:
             context.start()
             context.stop(
                 BadExceptionThatCannotBeStringified,
                 BadExceptionThatCannotBeStringified(),
             )
             assert mock_upd.call_args == mock.call(
+                context,
                 {
                     zipkin.ERROR_KEY: "BadExceptionThatCannotBeStringified: BadExceptionThatCannotBeStringified()"  # noqa
-                }
+                },
             )
             assert len(span_storage) == 0
 
@@ -645,8 +826,9 @@ class TestZipkinSpan:
             assert tracer.is_transport_configured() is False
             assert len(tracer.get_spans()) == 0
 
+    @mock.patch("time.perf_counter", autospec=True, side_effect=[10.0, 10.5])
     @mock.patch("time.time", autospec=True, return_value=123)
-    def test_stop_non_root(self, mock_time):
+    def test_stop_non_root(self, mock_time, mock_perf_counter):
         tracer = MockTracer()
         tracer.set_transport_configured(configured=True)
         tracer.get_context().push(zipkin.create_attrs_for_span())
@@ -666,7 +848,7 @@ class TestZipkinSpan:
             span_id=context.zipkin_attrs.span_id,
             kind=Kind.LOCAL,
             timestamp=123,
-            duration=0,
+            duration=0.5,
             annotations={},
             local_endpoint=endpoint,
             remote_endpoint=None,
@@ -707,6 +889,22 @@ class TestZipkinSpan:
 
         assert tracer.is_transport_configured() is True
 
+    @mock.patch.object(zipkin, "create_endpoint", wraps=create_endpoint)
+    def test_stop_non_root_reuses_endpoint(self, mock_create_endpoint):
+        zipkin._create_endpoint_cached.cache_clear()
+        tracer = MockTracer()
+        tracer.set_transport_configured(configured=True)
+        tracer.get_context().push(zipkin.create_attrs_for_span())
+        for _ in range(3):
+            with tracer.zipkin_span(service_name="test_service", span_name="span"):
+                pass
+
+        assert len(tracer.get_spans()) == 3
+        assert mock_create_endpoint.call_count == 1
+        assert mock_create_endpoint.call_args == mock.call(0, "test_service", None)
+        endpoints = {id(span.local_endpoint) for span in tracer.get_spans()}
+        assert len(endpoints) == 1
+
     def test_update_binary_annotations_root(self):
         with zipkin.zipkin_span(
             service_name="test_service",
@@ -867,6 +1065,18 @@ class TestZipkinSpan:
             assert span.logging_context.span_name == "new_name"
 
 
+def test_zipkin_span_has_no_instance_dict():
+    for span_class in (
+        zipkin.zipkin_span,
+        zipkin.zipkin_client_span,
+        zipkin.zipkin_server_span,
+    ):
+        span = span_class("test_service", "test_span")
+        assert not hasattr(span, "__dict__")
+        with pytest.raises(AttributeError):
+            span.not_a_span_attribute = True
+
+
 def test_zipkin_client_span():
     context = zipkin.zipkin_client_span("test_service", "test_span")
 
@@ -903,3 +1113,17 @@ def test_create_headers_for_new_span(mock_create_http_headers):
         tracer,
         True,
     )
+
+
+@mock.patch("py_zipkin.zipkin.create_http_header_items", autospec=True)
+def test_create_headers_for_new_span_items(mock_create_http_header_items):
+    tracer = MockTracer()
+    context_stack = Stack()
+    zipkin.create_http_headers_for_new_span_items(context_stack, tracer)
+
+    assert mock_create_http_header_items.call_count == 1
+    assert mock_create_http_header_items.call_args == mock.call(
+        context_stack,
+        tracer,
+        True,
+    )